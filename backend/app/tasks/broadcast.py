@@ -33,6 +33,7 @@ async def run_broadcast_worker(state: AppState) -> None:
 
     try:
         last_send_ts = 0.0
+        flood_until = 0.0
         min_interval = 1.0 / float(settings.broadcast.max_messages_per_second)
 
         while True:
@@ -68,11 +69,18 @@ async def run_broadcast_worker(state: AppState) -> None:
                 await asyncio.sleep(_lock_retry_delay(1))
                 continue
 
+            flood_wait = flood_until - time.monotonic()
+            if flood_wait > 0:
+                # Ждём частями: lock продлевается на каждом витке и не истекает за долгий retry_after.
+                await asyncio.sleep(min(flood_wait, settings.broadcast.lock_ttl_sec / 3))
+                continue
+
             await service.init_due_campaigns()
 
+            flooded = False
             for campaign_id in await service.list_active_campaign_ids():
                 batch = await service.claim_messages(campaign_id, batch_size=int(settings.broadcast.batch_size))
-                for mid, chat_id, attempt in batch:
+                for index, (mid, chat_id, attempt) in enumerate(batch):
                     wait = min_interval - (time.monotonic() - last_send_ts)
                     if wait > 0:
                         await asyncio.sleep(wait)
@@ -99,6 +107,22 @@ async def run_broadcast_worker(state: AppState) -> None:
                             attempt=attempt,
                         )
 
+                    if retry_after:
+                        # 429 — лимит на весь бот, а не на чат: остаток пачки возвращаем в очередь
+                        # без списания попытки, а пауза выдерживается в начале следующего витка,
+                        # после продления lock.
+                        flooded = True
+                        flood_until = time.monotonic() + retry_after
+                        for rest_mid, _, _ in batch[index + 1 :]:
+                            await service.release_message(message_id=rest_mid, retry_after_sec=retry_after)
+                        break
+
+                if flooded:
+                    break
+
+            if flooded:
+                continue
+
             await service.complete_finished_campaigns()
             await asyncio.sleep(float(settings.broadcast.tick_seconds))
 
@@ -39,6 +39,11 @@ async def runtime_start(bot: Bot, state: AppState, *, allowed_updates: list[str]
         raise RuntimeError("Проверка соединения с БД не пройдена при старте")
     logger.info("🗄 БД подключена")
 
+    # Профиль бота: aiogram кэширует getMe в bot.me() — прогреваем один раз,
+    # чтобы сборка share-ссылок не ходила в Telegram API.
+    me = await bot.me()
+    logger.info("🤖 Бот @%s", me.username)
+
     # Фоновая очистка
     logger.info("🚀 Запускаем фоновую задачу очистки видео…")
     state.cleanup_task = asyncio.create_task(cleanup_old_videos())
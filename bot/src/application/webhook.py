@@ -67,8 +67,8 @@ async def telegram_webhook(request: Request) -> dict[str, bool]:
     if secret_hdr != settings.webhooks.secret_token.get_secret_value():
         raise HTTPException(status_code=403, detail="Некорректный secret token")
 
-    data = await request.json()
-    update = Update.model_validate(data, context={"bot": bot})
+    # Разбор JSON и валидация за один проход pydantic-core, без промежуточного dict.
+    update = Update.model_validate_json(await request.body(), context={"bot": bot})
     await dp.feed_update(bot, update)
     return {"ok": True}
 
@@ -7,6 +7,8 @@ from packages.redis.repository import UserMessageIdsCacheRepository
 class MessageIdsStore:
     """Хранилище message_id, которые бот позже удаляет или схлопывает."""
 
+    __slots__ = ("_repo", "user_id")
+
     def __init__(self, redis: Redis, user_id: int) -> None:
         """Создаёт store для UI message_id конкретного пользователя."""
         self._repo = UserMessageIdsCacheRepository(redis)
@@ -1,4 +1,5 @@
-from contextlib import suppress
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 from aiogram import Bot
@@ -8,13 +9,21 @@ from aiogram.types import InlineKeyboardMarkup, Message
 
 from bot.src.bot_ui.message_ids import MessageIdsStore
 
+# Лимит Bot API на число message_id в одном deleteMessages.
+DELETE_MESSAGES_LIMIT = 100
+
 
 class MessageService:
     """Сервис Telegram UI-сообщений с трекингом отправленных message_id."""
 
+    # Сервис и stores создаются StoreMiddleware на каждый апдейт — держим их без __dict__.
+    __slots__ = ("message_ids_store", "_pending")
+
     def __init__(self, message_ids_store: MessageIdsStore) -> None:
         """Создаёт сервис поверх хранилища UI message_id."""
         self.message_ids_store = message_ids_store
+        # Буфер tracking_batch(): (chat_id, message_ids) или None вне батча.
+        self._pending: tuple[int | None, list[int]] | None = None
 
     async def safe_edit(
         self,
@@ -25,9 +34,19 @@ class MessageService:
         parse_mode: ParseMode | str | None = None,
         disable_web_page_preview: bool = False,
     ) -> None:
-        """Безопасно редактирует сообщение, гася ошибку «message is not modified»."""
+        """Безопасно редактирует сообщение, гася ошибку «message is not modified».
+
+        Повторное нажатие той же кнопки сверяется с текущим сообщением из
+        апдейта: при том же тексте меняется только разметка (или ничего), без
+        заведомо отклоняемого editMessageText.
+        """
         if not isinstance(message, Message):
             return
+        if message.text is not None and self._current_text(message, parse_mode) == text:
+            if message.reply_markup != reply_markup:
+                with suppress(TelegramBadRequest):
+                    await message.edit_reply_markup(reply_markup=reply_markup)
+            return
         try:
             await message.edit_text(
                 text,
@@ -41,6 +60,15 @@ class MessageService:
             with suppress(TelegramBadRequest):
                 await message.edit_reply_markup(reply_markup=reply_markup)
 
+    @staticmethod
+    def _current_text(message: Message, parse_mode: ParseMode | str | None) -> str | None:
+        """Текст сообщения в той же разметке, в которой его передают в safe_edit()."""
+        if parse_mode is None:
+            return message.text
+        if parse_mode == ParseMode.HTML:
+            return message.html_text
+        return None
+
     async def delete_message_safely(self, message: Message | None) -> None:
         """Удаляет сообщение, если оно доступно, игнорируя ошибки Telegram."""
         if not isinstance(message, Message):
@@ -50,21 +78,51 @@ class MessageService:
 
     async def delete_messages(self, bot: Bot, *, chat_id: int, message_ids: list[int]) -> None:
         """Удаляет перечисленные сообщения, игнорируя ошибки Telegram."""
-        for message_id in message_ids:
-            if not message_id:
-                continue
+        await self._delete_batch(bot, chat_id=chat_id, message_ids=[int(mid) for mid in message_ids if mid])
+
+    @staticmethod
+    async def _delete_batch(bot: Bot, *, chat_id: int, message_ids: list[int]) -> None:
+        """Удаляет сообщения через deleteMessages: один запрос на каждые 100 id.
+
+        Ненайденные и слишком старые сообщения Telegram пропускает сам.
+        """
+        for start in range(0, len(message_ids), DELETE_MESSAGES_LIMIT):
             with suppress(TelegramBadRequest):
-                await bot.delete_message(chat_id=chat_id, message_id=int(message_id))
+                await bot.delete_messages(
+                    chat_id=chat_id, message_ids=message_ids[start : start + DELETE_MESSAGES_LIMIT]
+                )
 
     async def track_message(self, *, chat_id: int | None, message_id: int) -> None:
         """Запоминает message_id пользователя для последующей очистки."""
         if chat_id is None:
             return
+        if self._pending is not None and self._pending[0] in (None, chat_id):
+            self._pending = (chat_id, [*self._pending[1], message_id])
+            return
         await self.message_ids_store.append(
             chat_id=chat_id,
             message_ids=[message_id],
         )
 
+    @asynccontextmanager
+    async def tracking_batch(self) -> AsyncIterator[None]:
+        """Копит message_id из *_and_track внутри блока и сохраняет их одним append при выходе.
+
+        Для последовательных отправок (видео + карточка): один read-modify-write
+        в Redis вместо пары на каждое сообщение.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = (None, [])
+        try:
+            yield
+        finally:
+            chat_id, message_ids = self._pending
+            self._pending = None
+            if chat_id is not None and message_ids:
+                await self.message_ids_store.append(chat_id=chat_id, message_ids=message_ids)
+
     async def answer_and_track(
         self,
         message: Message,
@@ -123,9 +181,7 @@ class MessageService:
             await self.message_ids_store.clear()
             return
 
-        for message_id in data.message_ids:
-            with suppress(TelegramBadRequest):
-                await bot.delete_message(chat_id=data.chat_id, message_id=message_id)
+        await self._delete_batch(bot, chat_id=data.chat_id, message_ids=data.message_ids)
         await self.message_ids_store.clear()
 
     async def delete_previous_random_video(self, bot: Bot, *, chat_id: int) -> None:
@@ -185,20 +241,18 @@ class MessageService:
         """Удаляет все затреканные сообщения, кроме последнего, и редактирует последнее."""
         data = await self.message_ids_store.get()
         chat = data.chat_id if data else None
-        message_ids = data.message_ids if data else None
-        if not isinstance(chat, int) or not isinstance(message_ids, list) or not message_ids:
-            return False
-        if not all(isinstance(mid, int) for mid in message_ids):
+        message_ids = data.message_ids if data and isinstance(data.message_ids, list) else []
+        # Один проход фильтрации: дальше id уже гарантированно int.
+        ids = [mid for mid in message_ids if isinstance(mid, int)]
+        if not isinstance(chat, int) or not ids:
             return False
         if chat != int(chat_id):
             await self.message_ids_store.clear()
             return False
 
-        for message_id in message_ids[:-1]:
-            with suppress(TelegramBadRequest):
-                await bot.delete_message(chat_id=chat, message_id=message_id)
+        *to_delete, last_message_id = ids
+        await self._delete_batch(bot, chat_id=chat, message_ids=to_delete)
 
-        last_message_id = message_ids[-1]
         try:
             await bot.edit_message_text(
                 chat_id=chat,
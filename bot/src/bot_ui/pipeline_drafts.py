@@ -7,6 +7,8 @@ from packages.redis.repository import PipelineDraftCacheRepository
 class PipelineDraftStore:
     """Хранилище черновиков пайплайна обработки видео для конкретного пользователя."""
 
+    __slots__ = ("_repo", "user_id")
+
     def __init__(self, redis: Redis, user_id: int) -> None:
         self._repo = PipelineDraftCacheRepository(redis)
         self.user_id = user_id
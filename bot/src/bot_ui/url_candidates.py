@@ -1,26 +1,25 @@
 from redis.asyncio import Redis
 
+from packages.redis.data_models import UrlCandidateState
 from packages.redis.repository import UrlCandidateCacheRepository
 
 
 class UrlCandidateStore:
     """Хранилище состояния выбора рецепта по ссылке для конкретного пользователя."""
 
+    __slots__ = ("_repo", "user_id")
+
     def __init__(self, redis: Redis, user_id: int) -> None:
         self._repo = UrlCandidateCacheRepository(redis)
         self.user_id = user_id
 
-    async def get(self, *, sid: str) -> dict | None:
+    async def get(self, *, sid: str) -> UrlCandidateState | None:
         """Возвращает состояние кандидата по идентификатору сессии или None."""
         return await self._repo.get(user_id=self.user_id, sid=sid)
 
-    async def set(self, *, sid: str, payload: dict) -> None:
-        """Сохраняет состояние кандидата."""
-        await self._repo.set(user_id=self.user_id, sid=sid, payload=payload)
-
-    async def set_merge(self, *, sid: str, patch: dict) -> None:
-        """Обновляет отдельные поля состояния кандидата, не затрагивая остальные."""
-        await self._repo.set_merge(user_id=self.user_id, sid=sid, patch=patch)
+    async def set(self, *, sid: str, state: UrlCandidateState) -> None:
+        """Сохраняет состояние кандидата целиком (без чтения старого значения)."""
+        await self._repo.set(user_id=self.user_id, sid=sid, state=state)
 
     async def delete(self, *, sid: str) -> None:
         """Удаляет состояние кандидата после завершения сценария выбора рецепта."""
@@ -0,0 +1,19 @@
+from aiogram.filters import BaseFilter
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery
+
+
+class CallbackPrefixFilter(BaseFilter):
+    """Пропускает callback, только если его префикс относится к одной из фабрик CallbackData.
+
+    Вешается на роутер целиком (`router.callback_query.filter(...)`): чужие callback
+    отсекаются одним set-lookup, без перебора хендлеров роутера и их `XxxCB.unpack`.
+    """
+
+    def __init__(self, *factories: type[CallbackData]) -> None:
+        self.prefixes = frozenset(factory.__prefix__ for factory in factories)
+        self.separators = frozenset(factory.__separator__ for factory in factories)
+
+    async def __call__(self, callback: CallbackQuery) -> bool:
+        data = callback.data or ""
+        return any(data.split(separator, 1)[0] in self.prefixes for separator in self.separators)
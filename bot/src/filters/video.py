@@ -11,16 +11,26 @@ _VIDEO_LINK_PATTERN = (
     r")/\S+"
 )
 _VIDEO_LINK_RE = re.compile(_VIDEO_LINK_PATTERN)
+# Хосты из _VIDEO_LINK_PATTERN вместе с обязательным «/»: дешёвая проверка подстрок
+# (C-уровень str.__contains__) отсекает обычный текст до запуска regex.
+_VIDEO_LINK_MARKERS = ("tiktok.com/", "instagram.com/", "pinterest.com/", "pinterest.co/", "pin.it/")
 
 _ANY_URL_RE = re.compile(r"https?://\S+")
 
 
+def _has_video_link(text: str) -> bool:
+    """Есть ли в тексте ссылка на поддерживаемое видео."""
+    if not any(marker in text for marker in _VIDEO_LINK_MARKERS):
+        return False
+    return bool(_VIDEO_LINK_RE.search(text))
+
+
 class VideoLinkFilter(BaseFilter):
     """Пропускает только текстовые сообщения, содержащие ссылку на поддерживаемое видео."""
 
     async def __call__(self, message: Message) -> bool:
         text = message.text or ""
-        return bool(text) and bool(_VIDEO_LINK_RE.search(text))
+        return bool(text) and _has_video_link(text)
 
 
 class UnsupportedLinkFilter(BaseFilter):
@@ -28,6 +38,6 @@ class UnsupportedLinkFilter(BaseFilter):
 
     async def __call__(self, message: Message) -> bool:
         text = message.text or ""
-        if not text:
+        if "http" not in text:
             return False
-        return bool(_ANY_URL_RE.search(text)) and not bool(_VIDEO_LINK_RE.search(text))
+        return bool(_ANY_URL_RE.search(text)) and not _has_video_link(text)
@@ -5,6 +5,7 @@ from aiogram.enums import ParseMode
 from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import AddCatCB, RecipeCB
 from bot.src.keyboards.menu import home_keyboard, start_keyboard
 from bot.src.keyboards.recipe import categories_add_keyboard
@@ -17,6 +18,7 @@ from packages.services.user_service import UserService
 logger = logging.getLogger(__name__)
 
 router = Router(name="add_recipe")
+router.callback_query.filter(CallbackPrefixFilter(AddCatCB, RecipeCB))
 
 
 @router.callback_query(RecipeCB.filter(F.action == "add"))
@@ -6,6 +6,7 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.interactions.recipe_browse import (
     show_random_recipe_from_category,
     show_recipe_card,
@@ -18,15 +19,15 @@ from bot.src.keyboards.recipe import (
     recipes_list_keyboard,
 )
 from bot.src.recipe_flow.book_slug import build_book_slug
-from bot.src.recipe_flow.list_state import RecipesStateData
-from bot.src.recipe_flow.modes import RecipeMode
-from packages.common_settings.settings import settings
+from bot.src.recipe_flow.list_state import RECIPES_PER_PAGE, RecipesStateData
+from bot.src.recipe_flow.modes import RecipeMode, parse_recipe_mode
 from packages.services.category_service import CategoryService
 from packages.services.recipe_service import RecipeService
 
 logger = logging.getLogger(__name__)
 
 router = Router(name="browse")
+router.callback_query.filter(CallbackPrefixFilter(BookCB, BookCatCB, CatCB, ChoiceCB, MenuCB))
 
 
 @router.callback_query(MenuCB.filter())
@@ -44,10 +45,7 @@ async def recipes_menu(
         return
     categories = await category_service.get_user_categories(user.id)
 
-    try:
-        mode = RecipeMode(callback_data.mode)
-    except ValueError:
-        mode = RecipeMode.SHOW
+    mode = parse_recipe_mode(callback_data.mode)
 
     if mode is RecipeMode.RANDOM:
         chat_id = callback.message.chat.id
@@ -134,20 +132,19 @@ async def recipes_book_from_category(
         )
         return
 
-    recipes_per_page = settings.telegram.recipes_per_page
-    recipes_total_pages = (len(pairs) + recipes_per_page - 1) // recipes_per_page
+    recipes_total_pages = (len(pairs) + RECIPES_PER_PAGE - 1) // RECIPES_PER_PAGE
     recipes_state = RecipesStateData.for_book(
         category_name=category.name,
         category_slug=category_slug,
+        category_id=category.id,
         recipes_total_pages=recipes_total_pages,
-        search_items=pairs,
     )
     await state.update_data(recipes_state=recipes_state.to_dict())
 
     markup = recipes_list_keyboard(
-        pairs,
+        pairs[:RECIPES_PER_PAGE],
         page=0,
-        per_page=recipes_per_page,
+        total_pages=recipes_total_pages,
         category_slug=build_book_slug(category_slug),
         mode=RecipeMode.SHOW,
         categories_callback=BookCB(),
@@ -177,7 +174,7 @@ async def recipes_from_category(
     if not isinstance(callback.message, Message):
         return
     category_slug = callback_data.slug
-    mode = RecipeMode(callback_data.mode)
+    mode = parse_recipe_mode(callback_data.mode)
 
     if mode is RecipeMode.RANDOM:
         await show_random_recipe_from_category(
@@ -229,8 +226,7 @@ async def _handle_show_from_category(
         )
         return
 
-    recipes_per_page = settings.telegram.recipes_per_page
-    recipes_total_pages = (len(pairs) + recipes_per_page - 1) // recipes_per_page
+    recipes_total_pages = (len(pairs) + RECIPES_PER_PAGE - 1) // RECIPES_PER_PAGE
     recipes_state = RecipesStateData.for_category(
         category_name=category.name,
         category_slug=category_slug,
@@ -241,9 +237,9 @@ async def _handle_show_from_category(
     await state.update_data(recipes_state=recipes_state.to_dict())
 
     markup = recipes_list_keyboard(
-        pairs,
+        pairs[:RECIPES_PER_PAGE],
         page=0,
-        per_page=recipes_per_page,
+        total_pages=recipes_total_pages,
         category_slug=category_slug,
         mode=mode,
     )
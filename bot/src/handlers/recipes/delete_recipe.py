@@ -6,6 +6,7 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import NavCB, RecipeCB
 from bot.src.keyboards.menu import home_keyboard
 from bot.src.keyboards.recipe import delete_confirm_keyboard
@@ -15,6 +16,7 @@ from packages.services.recipe_service import RecipeService
 logger = logging.getLogger(__name__)
 
 router = Router(name="delete_recipe")
+router.callback_query.filter(CallbackPrefixFilter(NavCB, RecipeCB))
 
 
 @router.callback_query(RecipeCB.filter(F.action == "delete"))
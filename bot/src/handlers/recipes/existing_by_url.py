@@ -7,7 +7,7 @@ from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
 from bot.src.bot_ui.url_candidates import UrlCandidateStore
-from bot.src.interactions.url_candidates import extract_allowed_recipe_ids
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import UrlCB
 from bot.src.keyboards.menu import home_keyboard
 from bot.src.keyboards.recipe import (
@@ -22,6 +22,7 @@ from packages.services.recipe_service import RecipeService
 logger = logging.getLogger(__name__)
 
 router = Router(name="existing_by_url")
+router.callback_query.filter(CallbackPrefixFilter(UrlCB))
 
 STALE_LIST_TEXT = "Список по ссылке устарел. Пришлите ссылку ещё раз."
 UNAVAILABLE_RECIPE_TEXT = "Этот рецепт больше недоступен в списке."
@@ -54,8 +55,7 @@ async def show_candidate_recipe(
         logger.warning("Состояние для user_id=%s, sid=%s не найдено при показе кандидата", user.id, sid)
         return
 
-    allowed = extract_allowed_recipe_ids(state)
-    if recipe_id not in allowed:
+    if recipe_id not in state.recipe_ids:
         await message_service.safe_edit(callback.message, UNAVAILABLE_RECIPE_TEXT, reply_markup=home_keyboard())
         logger.warning("recipe_id=%s не в allowed (user_id=%s, sid=%s)", recipe_id, user.id, sid)
         return
@@ -66,7 +66,7 @@ async def show_candidate_recipe(
         logger.warning("Рецепт recipe_id=%s не найден при показе кандидата", recipe_id)
         return
 
-    chat_id = _message_chat_id(callback.message) or int(state.get("chat_id") or 0)
+    chat_id = _message_chat_id(callback.message) or (state.chat_id or 0)
     if not chat_id:
         return
 
@@ -78,35 +78,32 @@ async def show_candidate_recipe(
 
     video_mid = None
     video_url = getattr(getattr(recipe, "video", None), "video_url", None)
-    if video_url:
-        try:
-            video_msg = await message_service.send_video_and_track(
-                bot,
-                chat_id=chat_id,
-                video=video_url,
-            )
-            video_mid = int(video_msg.message_id)
-        except TelegramBadRequest as e:
-            logger.warning("Не удалось отправить видео для recipe_id=%s: %s", recipe_id, e)
-
-    recipe_msg = await message_service.send_and_track(
-        bot,
-        chat_id=chat_id,
-        text=body,
-        parse_mode=ParseMode.HTML,
-        disable_web_page_preview=True,
-        reply_markup=url_candidate_recipe_keyboard(sid=sid, recipe_id=recipe_id, already_linked=already_linked),
-    )
-
-    await url_candidate_store.set_merge(
-        sid=sid,
-        patch={
-            "chat_id": chat_id,
-            "list_message_id": None,
-            "video_message_id": video_mid,
-            "recipe_message_id": int(recipe_msg.message_id),
-        },
-    )
+    async with message_service.tracking_batch():
+        if video_url:
+            try:
+                video_msg = await message_service.send_video_and_track(
+                    bot,
+                    chat_id=chat_id,
+                    video=video_url,
+                )
+                video_mid = int(video_msg.message_id)
+            except TelegramBadRequest as e:
+                logger.warning("Не удалось отправить видео для recipe_id=%s: %s", recipe_id, e)
+
+        recipe_msg = await message_service.send_and_track(
+            bot,
+            chat_id=chat_id,
+            text=body,
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+            reply_markup=url_candidate_recipe_keyboard(sid=sid, recipe_id=recipe_id, already_linked=already_linked),
+        )
+
+    state.chat_id = chat_id
+    state.list_message_id = None
+    state.video_message_id = video_mid
+    state.recipe_message_id = int(recipe_msg.message_id)
+    await url_candidate_store.set(sid=sid, state=state)
 
 
 @router.callback_query(UrlCB.filter(F.action == "list"))
@@ -129,7 +126,7 @@ async def show_candidates_list(
         logger.warning("Состояние для user_id=%s, sid=%s не найдено при показе списка", user.id, sid)
         return
 
-    chat_id = _message_chat_id(callback.message) or int(state.get("chat_id") or 0)
+    chat_id = _message_chat_id(callback.message) or (state.chat_id or 0)
     if not chat_id:
         return
 
@@ -137,12 +134,11 @@ async def show_candidates_list(
     msg_ids_to_delete: list[int] = []
     if isinstance(callback.message, Message):
         msg_ids_to_delete.append(int(callback.message.message_id))
-    if state.get("video_message_id"):
-        msg_ids_to_delete.append(int(state["video_message_id"]))
+    if state.video_message_id:
+        msg_ids_to_delete.append(state.video_message_id)
     await message_service.delete_messages(bot, chat_id=chat_id, message_ids=msg_ids_to_delete)
 
-    recipe_ids = extract_allowed_recipe_ids(state)
-    recipe_titles = await recipe_service.get_titles_for_ids(recipe_ids)
+    recipe_titles = await recipe_service.get_titles_for_ids(state.recipe_ids)
 
     sent = await message_service.send_and_track(
         bot,
@@ -150,15 +146,11 @@ async def show_candidates_list(
         text="По этой ссылке найдено несколько рецептов. Выберите нужный:",
         reply_markup=url_candidate_list_keyboard(sid, recipe_titles),
     )
-    await url_candidate_store.set_merge(
-        sid=sid,
-        patch={
-            "chat_id": chat_id,
-            "list_message_id": int(sent.message_id),
-            "video_message_id": None,
-            "recipe_message_id": None,
-        },
-    )
+    state.chat_id = chat_id
+    state.list_message_id = int(sent.message_id)
+    state.video_message_id = None
+    state.recipe_message_id = None
+    await url_candidate_store.set(sid=sid, state=state)
 
 
 @router.callback_query(UrlCB.filter(F.action == "add"))
@@ -180,8 +172,7 @@ async def add_candidate_recipe(
         logger.warning("Состояние для user_id=%s, sid=%s не найдено при добавлении", user.id, sid)
         return
 
-    allowed = extract_allowed_recipe_ids(state)
-    if recipe_id not in allowed:
+    if recipe_id not in state.recipe_ids:
         await message_service.safe_edit(callback.message, UNAVAILABLE_RECIPE_TEXT, reply_markup=home_keyboard())
         logger.warning("recipe_id=%s не в allowed (user_id=%s, sid=%s)", recipe_id, user.id, sid)
         return
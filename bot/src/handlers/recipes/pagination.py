@@ -5,18 +5,20 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import BookCB, PageCB
 from bot.src.keyboards.menu import home_keyboard
-from bot.src.keyboards.recipe import recipes_list_keyboard
+from bot.src.keyboards.recipe import recipes_list_keyboard, search_results_keyboard
 from bot.src.recipe_flow.book_slug import is_book_slug
-from bot.src.recipe_flow.list_state import RecipesStateData
-from bot.src.recipe_flow.modes import RecipeMode
-from packages.common_settings.settings import settings
+from bot.src.recipe_flow.list_state import RECIPES_PER_PAGE, RecipesStateData
+from bot.src.recipe_flow.modes import RecipeMode, parse_recipe_mode
+from packages.db.schemas import RecipeShort
 from packages.services.recipe_service import RecipeService
 
 logger = logging.getLogger(__name__)
 
 router = Router(name="pagination")
+router.callback_query.filter(CallbackPrefixFilter(PageCB))
 
 
 @router.callback_query(PageCB.filter())
@@ -37,23 +39,27 @@ async def handler_pagination(
     if not recipes_state_data:
         return
     recipes_state = RecipesStateData.from_dict(recipes_state_data)
+    if recipes_state.search:
+        await _paginate_search(
+            callback, callback_data, user, state, recipes_state, recipe_service, bot, message_service
+        )
+        return
     category_slug = callback_data.category or recipes_state.category_slug
     mode_raw = callback_data.mode or recipes_state.mode
 
-    items = recipes_state.search_items
-    if not items and recipes_state.category_id > 0:
-        items = await recipe_service.get_all_by_user_and_category(user.id, recipes_state.category_id)
+    items: list[RecipeShort] = []
+    if recipes_state.category_id > 0:
+        if is_book_slug(recipes_state.category_slug):
+            items = await recipe_service.get_book_recipes(recipes_state.category_id, exclude_user_id=user.id)
+        else:
+            items = await recipe_service.get_all_by_user_and_category(user.id, recipes_state.category_id)
     if not items:
         await message_service.safe_edit(callback.message, "Список рецептов пуст.", reply_markup=home_keyboard())
         return
 
-    per_page = settings.telegram.recipes_per_page
-    total_pages = max(1, (len(items) + per_page - 1) // per_page)
+    total_pages = max(1, (len(items) + RECIPES_PER_PAGE - 1) // RECIPES_PER_PAGE)
     page = max(0, min(callback_data.page, total_pages - 1))
-    try:
-        mode = RecipeMode(mode_raw)
-    except ValueError:
-        mode = RecipeMode.SHOW
+    mode = parse_recipe_mode(mode_raw)
 
     updated_recipes_state = recipes_state.with_pagination(
         page=page,
@@ -66,9 +72,9 @@ async def handler_pagination(
     categories_callback = BookCB() if is_book_slug(category_slug) else None
     logger.debug("Пагинация рецептов: page=%s category_slug=%s", page, category_slug)
     markup = recipes_list_keyboard(
-        items,
+        items[page * RECIPES_PER_PAGE : (page + 1) * RECIPES_PER_PAGE],
         page=page,
-        per_page=per_page,
+        total_pages=total_pages,
         category_slug=category_slug,
         mode=mode,
         categories_callback=categories_callback,
@@ -81,3 +87,52 @@ async def handler_pagination(
         reply_markup=markup,
         disable_web_page_preview=True,
     )
+
+
+async def _paginate_search(
+    callback: CallbackQuery,
+    callback_data: PageCB,
+    user: User,
+    state: FSMContext,
+    recipes_state: RecipesStateData,
+    recipe_service: RecipeService,
+    bot: Bot,
+    message_service: MessageService,
+) -> None:
+    """Страница поисковой выдачи по keyset-курсору из кнопки (или из state — «Назад» из карточки)."""
+    search = recipes_state.search or {}
+    if callback_data.after or callback_data.before:
+        after_id, before_id = callback_data.after, callback_data.before
+    else:
+        after_id, before_id = max(0, recipes_state.search_cursor - 1), 0
+
+    result = await recipe_service.search_page(
+        user.id,
+        search.get("type", "title"),
+        search.get("query", ""),
+        per_page=RECIPES_PER_PAGE,
+        after_id=after_id,
+        before_id=before_id,
+    )
+    if not result.items:
+        await message_service.safe_edit(callback.message, "Список рецептов пуст.", reply_markup=home_keyboard())
+        return
+
+    page = max(0, callback_data.page)
+    updated_recipes_state = recipes_state.with_pagination(
+        page=page,
+        total_pages=recipes_state.recipes_total_pages,
+        category_slug=recipes_state.category_slug,
+        mode=RecipeMode.SEARCH,
+        search_cursor=result.items[0].id,
+    )
+    await state.update_data(recipes_state=updated_recipes_state.to_dict())
+
+    logger.debug("Пагинация поиска: page=%s after=%s before=%s", page, after_id, before_id)
+    await message_service.collapse_or_edit(
+        callback.message,
+        bot,
+        title=updated_recipes_state.display_title,
+        reply_markup=search_results_keyboard(result.items, page, has_next=result.has_next),
+        disable_web_page_preview=True,
+    )
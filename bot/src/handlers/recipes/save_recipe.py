@@ -7,6 +7,7 @@ from aiogram.types import CallbackQuery, User
 
 from bot.src.bot_ui.messages import MessageService
 from bot.src.bot_ui.pipeline_drafts import PipelineDraftStore
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import CatCB, SaveCB
 from bot.src.keyboards.menu import home_keyboard
 from bot.src.keyboards.recipe import categories_save_keyboard
@@ -18,6 +19,7 @@ from packages.services.recipe_service import RecipeService
 logger = logging.getLogger(__name__)
 
 router = Router(name="save_recipe")
+router.callback_query.filter(CallbackPrefixFilter(CatCB, SaveCB))
 
 
 @router.callback_query(SaveCB.filter(F.action == "start"))
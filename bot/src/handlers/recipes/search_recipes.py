@@ -7,22 +7,22 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import NavCB, SearchCB, SearchTypeCB
 from bot.src.keyboards.menu import home_keyboard
 from bot.src.keyboards.recipe import (
     cancel_keyboard,
-    recipes_list_keyboard,
+    search_results_keyboard,
     search_type_keyboard,
 )
-from bot.src.recipe_flow.list_state import RecipesStateData
-from bot.src.recipe_flow.modes import RecipeMode
+from bot.src.recipe_flow.list_state import RECIPES_PER_PAGE, RecipesStateData
 from bot.src.recipe_flow.states import SearchRecipeStates
-from packages.common_settings.settings import settings
 from packages.services.recipe_service import RecipeService
 
 logger = logging.getLogger(__name__)
 
 router = Router(name="search_recipes")
+router.callback_query.filter(CallbackPrefixFilter(NavCB, SearchCB, SearchTypeCB))
 
 
 @router.callback_query(SearchCB.filter(F.action == "start"))
@@ -62,17 +62,25 @@ async def choose_search_type(
         await state.set_state(SearchRecipeStates.WAIT_INGREDIENT)
 
 
-async def _run_search(
+# Состояние ввода запроса → тип поиска (один хендлер на оба состояния).
+_SEARCH_TYPE_BY_STATE = {
+    SearchRecipeStates.WAIT_TITLE.state: "title",
+    SearchRecipeStates.WAIT_INGREDIENT.state: "ingredient",
+}
+
+
+@router.message(StateFilter(SearchRecipeStates.WAIT_TITLE, SearchRecipeStates.WAIT_INGREDIENT), F.text)
+async def handle_search_query(
     message: Message,
     state: FSMContext,
+    raw_state: str,
     user: User,
     recipe_service: RecipeService,
     bot: Bot,
     message_service: MessageService,
-    *,
-    search_type: str,
 ) -> None:
-    """Общая логика поиска по названию/ингредиенту и вывода результатов."""
+    """Поиск по названию или ингредиенту — тип берётся из текущего FSM-состояния."""
+    search_type = _SEARCH_TYPE_BY_STATE[raw_state]
     query = (message.text or "").strip()
     label = "названию" if search_type == "title" else "ингредиенту"
     empty_hint = "Пусто. Введите слово ещё раз." if search_type == "title" else "Пусто. Введите ингредиент ещё раз."
@@ -82,12 +90,9 @@ async def _run_search(
 
     await message_service.delete_tracked_messages(bot, chat_id=message.chat.id)
 
-    if search_type == "title":
-        items = await recipe_service.search_by_title(user.id, query)
-    else:
-        items = await recipe_service.search_by_ingredient(user.id, query)
+    result = await recipe_service.search_page(user.id, search_type, query, per_page=RECIPES_PER_PAGE)
 
-    if not items:
+    if not result.items:
         await state.clear()
         await message_service.answer_and_track(
             message,
@@ -97,23 +102,14 @@ async def _run_search(
         )
         return
 
-    recipes_per_page = settings.telegram.recipes_per_page
-    recipes_total_pages = (len(items) + recipes_per_page - 1) // recipes_per_page
     search_state = RecipesStateData.for_search(
         search_type=search_type,
         query=query,
-        recipes_total_pages=recipes_total_pages,
-        search_items=items,
+        search_cursor=result.items[0].id,
     )
     await state.update_data(recipes_state=search_state.to_dict())
 
-    markup = recipes_list_keyboard(
-        items,
-        page=0,
-        per_page=recipes_per_page,
-        category_slug="search",
-        mode=RecipeMode.SEARCH,
-    )
+    markup = search_results_keyboard(result.items, page=0, has_next=result.has_next)
     await message_service.answer_and_track(
         message,
         f"Результаты поиска по {label}: <b>{query}</b>",
@@ -126,48 +122,6 @@ async def _run_search(
     await state.set_state(None)
 
 
-@router.message(SearchRecipeStates.WAIT_TITLE, F.text)
-async def handle_title_query(
-    message: Message,
-    state: FSMContext,
-    user: User,
-    recipe_service: RecipeService,
-    bot: Bot,
-    message_service: MessageService,
-) -> None:
-    """Поиск по названию."""
-    await _run_search(
-        message,
-        state,
-        user,
-        recipe_service,
-        bot,
-        message_service,
-        search_type="title",
-    )
-
-
-@router.message(SearchRecipeStates.WAIT_INGREDIENT, F.text)
-async def handle_ingredient_query(
-    message: Message,
-    state: FSMContext,
-    user: User,
-    recipe_service: RecipeService,
-    bot: Bot,
-    message_service: MessageService,
-) -> None:
-    """Поиск по ингредиенту."""
-    await _run_search(
-        message,
-        state,
-        user,
-        recipe_service,
-        bot,
-        message_service,
-        search_type="ingredient",
-    )
-
-
 @router.callback_query(
     NavCB.filter(F.action == "cancel"),
     StateFilter(
@@ -7,12 +7,14 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.keyboards.callback_data import RecipeCB
 from bot.src.keyboards.menu import home_keyboard
 from bot.src.keyboards.recipe import choice_recipe_keyboard, share_recipe_keyboard
 from bot.src.recipe_flow.book_slug import is_book_slug
 from bot.src.recipe_flow.list_state import RecipesStateData
 from bot.src.recipe_flow.modes import RecipeMode
+from bot.src.utils.deep_link import SHARE_PREFIX
 from bot.src.utils.recipe_text import build_existing_recipe_text
 from bot.src.utils.share_token import encrypt_recipe_id
 from packages.services.recipe_service import RecipeService
@@ -20,12 +22,13 @@ from packages.services.recipe_service import RecipeService
 logger = logging.getLogger(__name__)
 
 router = Router(name="share_link")
+router.callback_query.filter(CallbackPrefixFilter(RecipeCB))
 
 
 async def build_recipe_share_link(bot: Bot, recipe_id: int | str) -> str:
     """
     Собирает deep-link для шаринга рецепта через параметр start.
-    Пример: https://t.me/<bot>?start=share_<token>
+    Пример: https://t.me/<bot>?start=s_<token>
     """
     recipe_id_str = str(recipe_id).strip()
     if not recipe_id_str:
@@ -33,9 +36,9 @@ async def build_recipe_share_link(bot: Bot, recipe_id: int | str) -> str:
         raise ValueError("recipe_id пустой")
 
     token = encrypt_recipe_id(recipe_id_str)
-    payload = f"share_{token}"
+    payload = f"{SHARE_PREFIX}{token}"
 
-    me = await bot.get_me()
+    me = await bot.me()
     username = me.username or ""
     if not username:
         raise RuntimeError("Username бота пустой")
@@ -119,12 +122,13 @@ async def share_recipe_back_handler(
         return
 
     video_url = getattr(getattr(recipe, "video", None), "video_url", None)
-    if video_url:
-        await message_service.answer_video_and_track(message, video_url)
-    await message_service.answer_and_track(
-        message,
-        build_existing_recipe_text(recipe),
-        parse_mode=ParseMode.HTML,
-        disable_web_page_preview=True,
-        reply_markup=keyboard,
-    )
+    async with message_service.tracking_batch():
+        if video_url:
+            await message_service.answer_video_and_track(message, video_url)
+        await message_service.answer_and_track(
+            message,
+            build_existing_recipe_text(recipe),
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+            reply_markup=keyboard,
+        )
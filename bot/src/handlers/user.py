@@ -7,6 +7,7 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message, User
 
 from bot.src.bot_ui.messages import MessageService
+from bot.src.filters.callback import CallbackPrefixFilter
 from bot.src.interactions.shared_recipe import show_shared_recipe
 from bot.src.interactions.start_menu import show_start_menu
 from bot.src.keyboards.callback_data import HelpCB, NavCB
@@ -18,6 +19,7 @@ from packages.services.recipe_service import RecipeService
 logger = logging.getLogger(__name__)
 
 router = Router(name="user")
+router.callback_query.filter(CallbackPrefixFilter(HelpCB, NavCB))
 
 
 @router.message(CommandStart())
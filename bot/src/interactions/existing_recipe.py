@@ -47,18 +47,19 @@ async def show_existing_recipe_if_found(
     recipe_id = match.recipe_ids[0]
     text = build_existing_recipe_text(recipe)
 
-    # Сначала отправляем видео, если оно есть.
-    if match.video_url:
-        await message_service.answer_video_and_track(message, match.video_url)
-
-    # Затем текст рецепта с подходящей клавиатурой.
     reply_markup = home_keyboard() if match.already_linked else add_recipe_keyboard(recipe_id)
     header = "Этот рецепт у Вас уже сохранён ✅" if match.already_linked else "Этот рецепт уже есть в нашем каталоге ✅"
-    await message_service.answer_and_track(
-        message,
-        f"{header}\n\n{text}",
-        parse_mode=ParseMode.HTML,
-        disable_web_page_preview=True,
-        reply_markup=reply_markup,
-    )
+    async with message_service.tracking_batch():
+        # Сначала отправляем видео, если оно есть.
+        if match.video_url:
+            await message_service.answer_video_and_track(message, match.video_url)
+
+        # Затем текст рецепта с подходящей клавиатурой.
+        await message_service.answer_and_track(
+            message,
+            f"{header}\n\n{text}",
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+            reply_markup=reply_markup,
+        )
     return True
@@ -47,15 +47,16 @@ async def show_random_recipe_from_category(
 
     video_url = getattr(getattr(recipe, "video", None), "video_url", None)
     text = f"Вот случайный рецепт из категории '{category.name}':\n\n{build_existing_recipe_text(recipe)}"
-    if video_url:
-        await message_service.answer_video_and_track(message, video_url)
-    await message_service.answer_and_track(
-        message,
-        text,
-        parse_mode=ParseMode.HTML,
-        disable_web_page_preview=True,
-        reply_markup=random_markup,
-    )
+    async with message_service.tracking_batch():
+        if video_url:
+            await message_service.answer_video_and_track(message, video_url)
+        await message_service.answer_and_track(
+            message,
+            text,
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+            reply_markup=random_markup,
+        )
 
 
 async def show_recipe_card(
@@ -94,12 +95,13 @@ async def show_recipe_card(
         return
 
     video_url = getattr(getattr(recipe, "video", None), "video_url", None)
-    if video_url:
-        await message_service.answer_video_and_track(message, video_url)
-    await message_service.answer_and_track(
-        message,
-        build_existing_recipe_text(recipe),
-        parse_mode=ParseMode.HTML,
-        disable_web_page_preview=True,
-        reply_markup=keyboard,
-    )
+    async with message_service.tracking_batch():
+        if video_url:
+            await message_service.answer_video_and_track(message, video_url)
+        await message_service.answer_and_track(
+            message,
+            build_existing_recipe_text(recipe),
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+            reply_markup=keyboard,
+        )
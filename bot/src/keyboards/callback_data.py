@@ -5,8 +5,13 @@
 аргументе `callback_data`.
 """
 
+from typing import Self
+
 from aiogram.filters.callback_data import CallbackData
 
+# Поля PageCB до появления keyset-курсора: page, category, mode.
+_LEGACY_PAGE_FIELDS = 3
+
 
 class NavCB(CallbackData, prefix="nav"):  # type: ignore[call-arg]
     """Навигация: домой/отмена/удаление. Пакуется в `nav:<action>`."""
@@ -51,11 +56,24 @@ class SaveCB(CallbackData, prefix="save"):  # type: ignore[call-arg]
 
 
 class PageCB(CallbackData, prefix="page"):  # type: ignore[call-arg]
-    """Пагинация списка рецептов (category/mode пустые — список без категории)."""
+    """Пагинация списка рецептов (category/mode пустые — список без категории).
+
+    after/before — keyset-курсор поисковой выдачи: id рецепта, после которого
+    (или перед которым) начинается страница; 0 — курсора нет.
+    """
 
     page: int
     category: str = ""
     mode: str = ""
+    after: int = 0
+    before: int = 0
+
+    @classmethod
+    def unpack(cls, value: str) -> Self:
+        """Принимает и старые кнопки `page:N:cat:mode`, отправленные до появления курсора."""
+        if value.count(cls.__separator__) == _LEGACY_PAGE_FIELDS:
+            value = cls.__separator__.join((value, "0", "0"))
+        return super().unpack(value)
 
 
 class UrlCB(CallbackData, prefix="url"):  # type: ignore[call-arg]
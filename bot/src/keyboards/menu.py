@@ -1,4 +1,10 @@
-"""Навигационные клавиатуры (старт/справка/домой) на InlineKeyboardBuilder + CallbackData."""
+"""Навигационные клавиатуры (старт/справка/домой) на InlineKeyboardBuilder + CallbackData.
+
+Все клавиатуры модуля статичны и кэшируются (`@cache`): вариантов разметки
+конечное число, а InlineKeyboardMarkup — неизменяемая модель.
+"""
+
+from functools import cache
 
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -6,6 +12,7 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from bot.src.keyboards.callback_data import BookCB, HelpCB, MenuCB, NavCB, SearchCB
 
 
+@cache
 def start_keyboard(new_user: bool) -> InlineKeyboardMarkup:
     """Кнопки стартового сообщения."""
     builder = InlineKeyboardBuilder()
@@ -23,8 +30,14 @@ def start_keyboard(new_user: bool) -> InlineKeyboardMarkup:
 
 def help_keyboard(topic: str | None = None) -> InlineKeyboardMarkup:
     """Кнопки раздела помощи."""
+    return _help_keyboard(bool(topic))
+
+
+@cache
+def _help_keyboard(in_topic: bool) -> InlineKeyboardMarkup:
+    """Разметка помощи: список разделов или навигация из раздела (сам topic ключом кэша не служит)."""
     builder = InlineKeyboardBuilder()
-    if topic:
+    if in_topic:
         builder.button(text="⬅️ К разделам", callback_data=HelpCB(topic="show"))
         builder.button(text="🏠 На главную", callback_data=NavCB(action="start"))
         builder.adjust(1)
@@ -42,6 +55,7 @@ def help_keyboard(topic: str | None = None) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def home_keyboard() -> InlineKeyboardMarkup:
     """Единственная кнопка «На главную»."""
     builder = InlineKeyboardBuilder()
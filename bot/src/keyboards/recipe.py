@@ -1,9 +1,16 @@
-"""Клавиатуры карточек рецептов, списков, шаринга, сохранения и выбора по ссылке."""
+"""Клавиатуры карточек рецептов, списков, шаринга, сохранения и выбора по ссылке.
 
-from collections.abc import Sequence
+Клавиатуры без аргументов кэшируются (`@cache`), клавиатуры карточек и меню
+категорий — по аргументам (`@lru_cache`): InlineKeyboardMarkup в aiogram —
+frozen pydantic-модель, один экземпляр безопасно отдавать во все ответы.
+"""
 
-from aiogram.filters.callback_data import CallbackData
-from aiogram.types import InlineKeyboardMarkup, WebAppInfo
+from __future__ import annotations
+
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from bot.src.keyboards.callback_data import (
@@ -21,9 +28,30 @@ from bot.src.keyboards.callback_data import (
 )
 from bot.src.recipe_flow.modes import RecipeMode
 from packages.common_settings.settings import settings
-from packages.db.schemas import CategoryRead, RecipeShort
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from aiogram.filters.callback_data import CallbackData
+
+    from packages.db.schemas import CategoryRead, RecipeShort
+
+# Настройки неизменны после старта: URL веб-приложения собирается один раз.
+_EDIT_RECIPE_WEBAPP_URL = f"{settings.fast_api.base_url()}/webapp/edit-recipe.html"
 
+# Режим в callback карточки: поиск открывает карточку как обычный просмотр.
+_LIST_MODE_SUFFIX = {mode: (RecipeMode.SHOW if mode is RecipeMode.SEARCH else mode).value for mode in RecipeMode}
+# Статичные кнопки навигации списка рецептов (InlineKeyboardButton — неизменяемая модель).
+_CATEGORIES_BACK_BUTTONS = {
+    suffix: InlineKeyboardButton(text="📚 К категориям", callback_data=MenuCB(mode=suffix).pack())
+    for suffix in set(_LIST_MODE_SUFFIX.values())
+}
+_LIST_HOME_BUTTON = InlineKeyboardButton(text="🏠 В меню", callback_data=NavCB(action="start").pack())
+_HOME_BUTTON = InlineKeyboardButton(text="🏠 На главную", callback_data=NavCB(action="start").pack())
+_CATEGORY_PICKER_BACK_BUTTON = InlineKeyboardButton(text="🔙 Назад", callback_data=NavCB(action="start").pack())
+
+
+@lru_cache(maxsize=2048)
 def add_recipe_keyboard(recipe_id: int) -> InlineKeyboardMarkup:
     """Карточка рецепта по deep-link/каталогу: добавить к себе / на главную."""
     builder = InlineKeyboardBuilder()
@@ -33,6 +61,7 @@ def add_recipe_keyboard(recipe_id: int) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=2048)
 def share_recipe_keyboard(recipe_id: int) -> InlineKeyboardMarkup:
     """Сообщение со ссылкой на шаринг рецепта."""
     builder = InlineKeyboardBuilder()
@@ -42,6 +71,7 @@ def share_recipe_keyboard(recipe_id: int) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=2048)
 def choice_recipe_keyboard(
     recipe_id: int,
     page: int,
@@ -57,8 +87,7 @@ def choice_recipe_keyboard(
         builder.button(text="➕ Добавить к себе", callback_data=RecipeCB(action="add", recipe_id=recipe_id))
     else:
         if can_manage:
-            base = settings.fast_api.base_url()
-            webapp_url = f"{base}/webapp/edit-recipe.html?recipe_id={int(recipe_id)}"
+            webapp_url = f"{_EDIT_RECIPE_WEBAPP_URL}?recipe_id={int(recipe_id)}"
             builder.button(text="✏️ Редактировать рецепт", web_app=WebAppInfo(url=webapp_url))
             builder.button(text="🗑 Удалить рецепт", callback_data=RecipeCB(action="delete", recipe_id=recipe_id))
         builder.button(text="📤 Поделиться рецептом", callback_data=RecipeCB(action="share", recipe_id=recipe_id))
@@ -92,13 +121,14 @@ def url_candidate_list_keyboard(sid: str, recipe_titles: list[RecipeShort]) -> I
 
 def url_candidate_recipe_keyboard(*, sid: str, recipe_id: int, already_linked: bool) -> InlineKeyboardMarkup:
     """Карточка рецепта, открытого из списка кандидатов по ссылке."""
-    builder = InlineKeyboardBuilder()
+    rows = [
+        [InlineKeyboardButton(text="⬅️ Назад к списку", callback_data=UrlCB(action="list", sid=sid).pack())],
+        [_HOME_BUTTON],
+    ]
     if not already_linked:
-        builder.button(text="➕ Добавить к себе", callback_data=UrlCB(action="add", sid=sid, recipe_id=recipe_id))
-    builder.button(text="⬅️ Назад к списку", callback_data=UrlCB(action="list", sid=sid))
-    builder.button(text="🏠 На главную", callback_data=NavCB(action="start"))
-    builder.adjust(1)
-    return builder.as_markup()
+        add_cb = UrlCB(action="add", sid=sid, recipe_id=recipe_id).pack()
+        rows.insert(0, [InlineKeyboardButton(text="➕ Добавить к себе", callback_data=add_cb)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def url_candidate_category_keyboard(
@@ -119,6 +149,7 @@ def url_candidate_category_keyboard(
     return builder.as_markup()
 
 
+@lru_cache(maxsize=2048)
 def random_recipe_keyboard(category_slug: str) -> InlineKeyboardMarkup:
     """Кнопки под случайным рецептом."""
     builder = InlineKeyboardBuilder()
@@ -129,20 +160,36 @@ def random_recipe_keyboard(category_slug: str) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def _fill_categories(
-    builder: InlineKeyboardBuilder,
+def _category_picker(
     categories: Sequence[CategoryRead],
-    callback_for_slug,
-) -> None:
-    """Добавляет кнопки категорий (slug → CallbackData)."""
-    for category in categories:
-        builder.button(text=category.name, callback_data=callback_for_slug(category.slug))
+    callback_for_slug: Callable[[str], CallbackData],
+    last: InlineKeyboardButton,
+) -> InlineKeyboardMarkup:
+    """Кнопка на категорию (slug → CallbackData) и завершающая кнопка — по одной в ряд, без builder.adjust()."""
+    rows = [
+        [InlineKeyboardButton(text=category.name, callback_data=callback_for_slug(category.slug).pack())]
+        for category in categories
+    ]
+    rows.append([last])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+def _category_pairs(categories: Sequence[CategoryRead]) -> tuple[tuple[str, str], ...]:
+    """Хешируемый ключ кэша клавиатур категорий: (name, slug) в порядке показа."""
+    return tuple((category.name, category.slug) for category in categories)
 
 
 def categories_menu_keyboard(categories: Sequence[CategoryRead], mode: RecipeMode) -> InlineKeyboardMarkup:
     """Категории «Мои рецепты»/«Случайные»."""
+    return _categories_menu_markup(_category_pairs(categories), mode)
+
+
+@lru_cache(maxsize=128)
+def _categories_menu_markup(pairs: tuple[tuple[str, str], ...], mode: RecipeMode) -> InlineKeyboardMarkup:
+    """Меню категорий по (name, slug) и режиму; разметка общая для всех вызовов — не изменять."""
     builder = InlineKeyboardBuilder()
-    _fill_categories(builder, categories, lambda slug: CatCB(slug=slug, mode=mode.value))
+    for name, slug in pairs:
+        builder.button(text=name, callback_data=CatCB(slug=slug, mode=mode.value))
     builder.button(text="🔙 Назад", callback_data=NavCB(action="start"))
     builder.adjust(1)
     return builder.as_markup()
@@ -150,8 +197,15 @@ def categories_menu_keyboard(categories: Sequence[CategoryRead], mode: RecipeMod
 
 def categories_book_keyboard(categories: Sequence[CategoryRead]) -> InlineKeyboardMarkup:
     """Категории книги рецептов."""
+    return _categories_book_markup(_category_pairs(categories))
+
+
+@lru_cache(maxsize=128)
+def _categories_book_markup(pairs: tuple[tuple[str, str], ...]) -> InlineKeyboardMarkup:
+    """Категории книги по (name, slug); разметка общая для всех вызовов — не изменять."""
     builder = InlineKeyboardBuilder()
-    _fill_categories(builder, categories, lambda slug: BookCatCB(slug=slug))
+    for name, slug in pairs:
+        builder.button(text=name, callback_data=BookCatCB(slug=slug))
     builder.button(text="🔙 Назад", callback_data=NavCB(action="start"))
     builder.adjust(1)
     return builder.as_markup()
@@ -159,59 +213,97 @@ def categories_book_keyboard(categories: Sequence[CategoryRead]) -> InlineKeyboa
 
 def categories_save_keyboard(categories: Sequence[CategoryRead], pipeline_id: int) -> InlineKeyboardMarkup:
     """Выбор категории при сохранении распознанного рецепта."""
-    builder = InlineKeyboardBuilder()
-    _fill_categories(builder, categories, lambda slug: CatCB(slug=slug, mode="save", pipeline_id=pipeline_id))
-    builder.button(text="❌ Отмена", callback_data=SaveCB(action="cancel", pipeline_id=pipeline_id))
-    builder.adjust(1)
-    return builder.as_markup()
+    return _category_picker(
+        categories,
+        lambda slug: CatCB(slug=slug, mode="save", pipeline_id=pipeline_id),
+        InlineKeyboardButton(text="❌ Отмена", callback_data=SaveCB(action="cancel", pipeline_id=pipeline_id).pack()),
+    )
 
 
 def categories_add_keyboard(categories: Sequence[CategoryRead], recipe_id: int) -> InlineKeyboardMarkup:
     """Выбор категории при добавлении существующего рецепта к себе."""
-    builder = InlineKeyboardBuilder()
-    _fill_categories(builder, categories, lambda slug: AddCatCB(recipe_id=recipe_id, slug=slug))
-    builder.button(text="🔙 Назад", callback_data=NavCB(action="start"))
-    builder.adjust(1)
-    return builder.as_markup()
+    return _category_picker(
+        categories,
+        lambda slug: AddCatCB(recipe_id=recipe_id, slug=slug),
+        _CATEGORY_PICKER_BACK_BUTTON,
+    )
 
 
 def recipes_list_keyboard(
     items: list[RecipeShort],
     page: int = 0,
     *,
-    per_page: int = settings.telegram.recipes_per_page,
+    total_pages: int,
     category_slug: str,
     mode: RecipeMode = RecipeMode.SHOW,
     categories_callback: CallbackData | None = None,
 ) -> InlineKeyboardMarkup:
-    """Список рецептов с пагинацией."""
-    total = len(items)
-    start = max(0, page) * per_page
-    end = min(total, start + per_page)
-    current = items[start:end]
-    suffix = RecipeMode.SHOW.value if mode is RecipeMode.SEARCH else mode.value
-    builder = InlineKeyboardBuilder()
-
-    for recipe in current:
-        builder.button(
-            text=f"▪️ {recipe.title}",
-            callback_data=ChoiceCB(category=category_slug, mode=suffix, recipe_id=recipe.id),
+    """Страница списка рецептов с пагинацией.
+
+    ``items`` — уже нарезанная текущая страница, ``total_pages`` считается
+    вызывающей стороной один раз: клавиатура не трогает остальные страницы.
+    """
+    return _recipes_page_markup(
+        items,
+        next_callback=PageCB(page=page + 1) if page + 1 < total_pages else None,
+        prev_callback=PageCB(page=page - 1) if page > 0 else None,
+        category_slug=category_slug,
+        mode=mode,
+        categories_callback=categories_callback,
+    )
+
+
+def search_results_keyboard(items: list[RecipeShort], page: int, *, has_next: bool) -> InlineKeyboardMarkup:
+    """Страница поисковой выдачи: «Далее»/«Назад» несут keyset-курсор по id рецепта."""
+    return _recipes_page_markup(
+        items,
+        next_callback=PageCB(page=page + 1, after=items[-1].id) if has_next and items else None,
+        prev_callback=PageCB(page=page - 1, before=items[0].id) if page > 0 and items else None,
+        category_slug="search",
+        mode=RecipeMode.SEARCH,
+    )
+
+
+def _recipes_page_markup(
+    current: list[RecipeShort],
+    *,
+    next_callback: CallbackData | None,
+    prev_callback: CallbackData | None,
+    category_slug: str,
+    mode: RecipeMode,
+    categories_callback: CallbackData | None = None,
+) -> InlineKeyboardMarkup:
+    """Кнопки рецептов текущей страницы + навигация.
+
+    Каждая кнопка в своём ряду, поэтому ряды собираются напрямую, без
+    InlineKeyboardBuilder и его перераскладки в adjust(1): эта клавиатура
+    строится на каждый шаг пагинации и не кэшируется.
+    """
+    suffix = _LIST_MODE_SUFFIX[mode]
+    buttons = [
+        InlineKeyboardButton(
+            text="▪️ " + recipe.title,
+            callback_data=ChoiceCB(category=category_slug, mode=suffix, recipe_id=recipe.id).pack(),
         )
+        for recipe in current
+    ]
 
-    if end < total:
-        builder.button(text="Далее ⏩", callback_data=PageCB(page=page + 1))
-    if page > 0:
-        builder.button(text="⏪ Назад", callback_data=PageCB(page=page - 1))
+    if next_callback is not None:
+        buttons.append(InlineKeyboardButton(text="Далее ⏩", callback_data=next_callback.pack()))
+    if prev_callback is not None:
+        buttons.append(InlineKeyboardButton(text="⏪ Назад", callback_data=prev_callback.pack()))
 
     if mode is not RecipeMode.SEARCH:
-        back = categories_callback or MenuCB(mode=suffix)
-        builder.button(text="📚 К категориям", callback_data=back)
-    builder.button(text="🏠 В меню", callback_data=NavCB(action="start"))
+        if categories_callback is not None:
+            buttons.append(InlineKeyboardButton(text="📚 К категориям", callback_data=categories_callback.pack()))
+        else:
+            buttons.append(_CATEGORIES_BACK_BUTTONS[suffix])
+    buttons.append(_LIST_HOME_BUTTON)
 
-    builder.adjust(1)
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[[button] for button in buttons])
 
 
+@cache
 def search_type_keyboard() -> InlineKeyboardMarkup:
     """Выбор типа поиска."""
     builder = InlineKeyboardBuilder()
@@ -222,6 +314,7 @@ def search_type_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def cancel_keyboard() -> InlineKeyboardMarkup:
     """Кнопка отмены."""
     builder = InlineKeyboardBuilder()
@@ -229,6 +322,7 @@ def cancel_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def delete_confirm_keyboard() -> InlineKeyboardMarkup:
     """Подтверждение удаления рецепта."""
     builder = InlineKeyboardBuilder()
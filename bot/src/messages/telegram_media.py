@@ -38,6 +38,13 @@ def _probe_video_dimensions(video_path: Path) -> tuple[int | None, int | None]:
         return None, None
 
 
+def _inspect_video(video_path: Path) -> tuple[bool, int | None, int | None]:
+    """Проверяет наличие файла и возвращает (exists, width, height)."""
+    if not video_path.is_file():
+        return False, None, None
+    return True, *_probe_video_dimensions(video_path)
+
+
 async def send_video_to_channel(
     bot: Bot,
     converted_video_path: str,
@@ -49,12 +56,13 @@ async def send_video_to_channel(
     Функция отправляет видео в канал и возвращает ссылку на видео.
     """
     p = Path(converted_video_path)
-    if not p.is_file():
+    # stat и ffprobe блокируют, поэтому уводим их в поток; сам файл
+    # FSInputFile читает через aiofiles на каждой попытке.
+    exists, width, height = await asyncio.to_thread(_inspect_video, p)
+    if not exists:
         logger.error("Видео не найдено: %s", p)
         return ""
 
-    width, height = _probe_video_dimensions(p)
-
     for attempt in range(1, max_retries + 1):
         try:
             msg = await bot.send_video(
@@ -30,7 +30,7 @@ class UserMiddleware(BaseMiddleware):
         user_recipe_count: int | None = None
         user_service = data.get("user_service")
         if user is not None and isinstance(user_service, UserService):
-            await user_service.ensure_user_exists(
+            user_recipe_count = await user_service.ensure_user_and_get_recipe_count(
                 UserCreate(
                     id=user.id,
                     username=user.username,
@@ -38,6 +38,5 @@ class UserMiddleware(BaseMiddleware):
                     last_name=user.last_name,
                 )
             )
-            user_recipe_count = await user_service.get_recipe_count(user.id)
         data["user_recipe_count"] = user_recipe_count
         return await handler(event, data)
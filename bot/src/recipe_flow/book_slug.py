@@ -7,7 +7,7 @@
 import re
 
 _BOOK_SLUG_PREFIX = "book_"
-_SLUG_PATTERN = r"[a-z0-9][a-z0-9_-]*"
+_SLUG_RE = re.compile(r"[a-z0-9][a-z0-9_-]*")
 
 
 def build_book_slug(category_slug: str) -> str:
@@ -22,4 +22,4 @@ def parse_book_slug(category_slug: str | None) -> str | None:
     if not is_book_slug(category_slug):
         return None
     slug = str(category_slug).removeprefix(_BOOK_SLUG_PREFIX).strip().lower()
-    return slug if re.fullmatch(_SLUG_PATTERN, slug) else None
+    return slug if _SLUG_RE.fullmatch(slug) else None
@@ -4,7 +4,10 @@ from dataclasses import dataclass
 
 from bot.src.recipe_flow.book_slug import build_book_slug
 from bot.src.recipe_flow.modes import RecipeMode
-from packages.db.schemas import RecipeShort
+from packages.common_settings.settings import settings
+
+# Размер страницы списков рецептов; настройки неизменны после старта — читаем один раз.
+RECIPES_PER_PAGE: int = settings.telegram.recipes_per_page
 
 
 @dataclass(slots=True)
@@ -18,8 +21,8 @@ class RecipesStateData:
     mode: str = RecipeMode.SHOW.value
     category_name: str | None = None
     list_title: str | None = None
-    search_items: list[RecipeShort] | None = None
     search: dict[str, str] | None = None
+    search_cursor: int = 0  # id первого рецепта текущей страницы поиска (keyset)
 
     @property
     def display_title(self) -> str:
@@ -35,6 +38,7 @@ class RecipesStateData:
         total_pages: int,
         category_slug: str,
         mode: RecipeMode,
+        search_cursor: int | None = None,
     ) -> RecipesStateData:
         """Возвращает обновлённый state после смены страницы списка рецептов."""
         return RecipesStateData(
@@ -45,8 +49,8 @@ class RecipesStateData:
             mode=mode.value,
             category_name=self.category_name,
             list_title=self.list_title,
-            search_items=self.search_items,
             search=self.search,
+            search_cursor=self.search_cursor if search_cursor is None else search_cursor,
         )
 
     @classmethod
@@ -62,12 +66,8 @@ class RecipesStateData:
             mode=str(data.get("mode", RecipeMode.SHOW.value) or RecipeMode.SHOW.value),
             category_name=str(data["category_name"]) if data.get("category_name") is not None else None,
             list_title=str(data["list_title"]) if data.get("list_title") is not None else None,
-            search_items=(
-                [RecipeShort.model_validate(x) for x in data["search_items"]]
-                if isinstance(data.get("search_items"), list)
-                else None
-            ),
             search=data.get("search") if isinstance(data.get("search"), dict) else None,
+            search_cursor=int(data.get("search_cursor", 0) or 0),
         )
 
     def to_dict(self) -> dict[str, object]:
@@ -83,10 +83,9 @@ class RecipesStateData:
             data["category_name"] = self.category_name
         if self.list_title is not None:
             data["list_title"] = self.list_title
-        if self.search_items is not None:
-            data["search_items"] = [r.model_dump() for r in self.search_items]
         if self.search is not None:
             data["search"] = self.search
+            data["search_cursor"] = self.search_cursor
         return data
 
     @classmethod
@@ -115,19 +114,18 @@ class RecipesStateData:
         *,
         category_name: str,
         category_slug: str,
+        category_id: int,
         recipes_total_pages: int,
-        search_items: list[RecipeShort],
     ) -> RecipesStateData:
-        """Создаёт state для книги рецептов."""
+        """Создаёт state для книги рецептов; сам список берётся из кэша по category_id."""
         return cls(
             recipes_page=0,
             recipes_total_pages=recipes_total_pages,
             category_name=category_name,
             category_slug=build_book_slug(category_slug),
-            category_id=0,
+            category_id=category_id,
             mode=RecipeMode.SHOW.value,
             list_title=f"📚 Книга рецептов • {category_name}",
-            search_items=search_items,
         )
 
     @classmethod
@@ -136,18 +134,16 @@ class RecipesStateData:
         *,
         search_type: str,
         query: str,
-        recipes_total_pages: int,
-        search_items: list[RecipeShort],
+        search_cursor: int,
     ) -> RecipesStateData:
-        """Создаёт state для поисковой выдачи."""
+        """Создаёт state для поисковой выдачи (первая страница, keyset-курсор)."""
         search_label = "названию" if search_type == "title" else "ингредиенту"
         return cls(
             recipes_page=0,
-            recipes_total_pages=recipes_total_pages,
             category_slug="search",
             category_id=0,
             mode=RecipeMode.SEARCH.value,
             list_title=f"Результаты поиска по {search_label}: «{query}»",
-            search_items=search_items,
             search={"type": search_type, "query": query},
+            search_cursor=search_cursor,
         )
@@ -6,3 +6,11 @@ class RecipeMode(Enum):
     RANDOM = "random"
     SAVE = "save"
     SEARCH = "search"
+
+
+_MODE_BY_VALUE: dict[str, RecipeMode] = {mode.value: mode for mode in RecipeMode}
+
+
+def parse_recipe_mode(raw: str) -> RecipeMode:
+    """Режим из callback-строки; неизвестное значение — RecipeMode.SHOW."""
+    return _MODE_BY_VALUE.get(raw, RecipeMode.SHOW)
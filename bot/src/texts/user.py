@@ -1,7 +1,11 @@
+from html import escape
+
 from aiogram.types import User
 
-_START_TEXT_NEW_USER = (
-    "Привет, {user.first_name}! 👋\n\n"
+# Приветствие разбито вокруг имени: одна подстановка — конкатенация, без разбора format-строки.
+_START_GREETING_PREFIX = "Привет, "
+_START_TEXT_NEW_USER_SUFFIX = (
+    "! 👋\n\n"
     "Я помогу сохранить рецепт из видео и быстро вернуть его, когда он понадобится.\n\n"
     "<b>Как начать:</b>\n"
     "1️⃣ Отправьте ссылку на видео из TikTok, Reels или Pinterest\n"
@@ -91,7 +95,7 @@ _HELP_TOPICS: dict[str, str] = {
 def render_start_text(user: User, *, new_user: bool) -> str:
     """Возвращает текст стартового меню для нового или существующего пользователя."""
     if new_user:
-        return _START_TEXT_NEW_USER.format(user=user)
+        return _START_GREETING_PREFIX + escape(user.first_name) + _START_TEXT_NEW_USER_SUFFIX
     return _START_TEXT_USER
 
 
@@ -1,12 +1,27 @@
-# Telegram deep-link `start` payloads: `share_<token>` (и легаси `share:<token>`).
-_SHARE_PREFIXES = ("share_", "share:")
+from typing import NamedTuple
 
+# Telegram deep-link `start` payloads: `s_<token>` (keyed BLAKE2b) и легаси
+# `share_<token>` / `share:<token>` (sha256-поток) — старые ссылки должны открываться.
+SHARE_PREFIX = "s_"
+_LEGACY_SHARE_PREFIXES = ("share_", "share:")
 
-def parse_shared_token(args: str | None) -> str | None:
+
+class SharedToken(NamedTuple):
+    """Токен шаринга из payload /start и флаг легаси-схемы шифрования."""
+
+    value: str
+    legacy: bool = False
+
+
+def parse_shared_token(args: str | None) -> SharedToken | None:
     """Извлекает токен шаринга из payload команды /start."""
     if not args:
         return None
-    for prefix in _SHARE_PREFIXES:
+    if args.startswith(SHARE_PREFIX):
+        value = args.removeprefix(SHARE_PREFIX).strip()
+        return SharedToken(value) if value else None
+    for prefix in _LEGACY_SHARE_PREFIXES:
         if args.startswith(prefix):
-            return args.removeprefix(prefix).strip() or None
+            value = args.removeprefix(prefix).strip()
+            return SharedToken(value, legacy=True) if value else None
     return None
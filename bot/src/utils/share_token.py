@@ -2,14 +2,16 @@ import base64
 import binascii
 import hashlib
 import os
+from functools import lru_cache
 
 from packages.common_settings.settings import settings
 
 TOKEN_NONCE_LEN = 8
 
 
+@lru_cache(maxsize=1)
 def pepper_bytes() -> bytes:
-    """Возвращает секретный ключ (pepper) в байтах."""
+    """Возвращает секретный ключ (pepper) в байтах; настройки неизменны — считается один раз."""
     pepper = settings.security.password_pepper
     if not pepper:
         raise RuntimeError("PASSWORD_PEPPER не задан")
@@ -17,15 +19,41 @@ def pepper_bytes() -> bytes:
 
 
 def derive_keystream(pepper: bytes, nonce: bytes, length: int) -> bytes:
-    """Детерминированно строит псевдослучайный поток байт из pepper и nonce."""
-    out = bytearray()
-    counter = 0
-    while len(out) < length:
-        counter_bytes = counter.to_bytes(4, "big", signed=False)
-        block = hashlib.sha256(pepper + nonce + counter_bytes).digest()
-        out.extend(block)
-        counter += 1
-    return bytes(out[:length])
+    """Легаси-поток: блок i = sha256(pepper + nonce + i). Только для ссылок `share_`/`share:`.
+
+    Префикс pepper + nonce хешируется один раз, на блок остаётся copy() состояния
+    и 4 байта счётчика.
+    """
+    prefix = hashlib.sha256(pepper + nonce)
+    blocks = []
+    for counter in range(-(-length // prefix.digest_size)):
+        block = prefix.copy()
+        block.update(counter.to_bytes(4, "big", signed=False))
+        blocks.append(block.digest())
+    return b"".join(blocks)[:length]
+
+
+@lru_cache(maxsize=1)
+def share_key(pepper: bytes) -> bytes:
+    """64-байтовый ключ BLAKE2b из pepper (длина pepper не ограничена лимитом key в 64 байта)."""
+    return hashlib.blake2b(pepper, person=b"share-token").digest()
+
+
+def derive_keyed_keystream(key: bytes, nonce: bytes, length: int) -> bytes:
+    """Поток как keyed BLAKE2b (PRF) от nonce + счётчика; ключ не конкатенируется с данными."""
+    prefix = hashlib.blake2b(nonce, key=key)
+    blocks = []
+    for counter in range(-(-length // prefix.digest_size)):
+        block = prefix.copy()
+        block.update(counter.to_bytes(4, "big", signed=False))
+        blocks.append(block.digest())
+    return b"".join(blocks)[:length]
+
+
+def xor_bytes(data: bytes, stream: bytes) -> bytes:
+    """XOR данных с потоком той же длины одной операцией над big-int, без цикла по байтам."""
+    value = int.from_bytes(data, "big") ^ int.from_bytes(stream[: len(data)], "big")
+    return value.to_bytes(len(data), "big")
 
 
 def urlsafe_b64encode_nopad(data: bytes) -> str:
@@ -40,17 +68,21 @@ def urlsafe_b64decode_padded(data: str) -> bytes:
 
 
 def encrypt_recipe_id(recipe_id: str) -> str:
-    """Шифрует recipe_id в токен для шаринга."""
-    pepper = pepper_bytes()
+    """Шифрует recipe_id в токен для шаринга (keyed BLAKE2b)."""
     nonce = os.urandom(TOKEN_NONCE_LEN)
     plaintext = recipe_id.encode("utf-8")
-    stream = derive_keystream(pepper, nonce, len(plaintext))
-    ciphertext = bytes(a ^ b for a, b in zip(plaintext, stream, strict=False))
-    return urlsafe_b64encode_nopad(nonce + ciphertext)
+    stream = derive_keyed_keystream(share_key(pepper_bytes()), nonce, len(plaintext))
+    return urlsafe_b64encode_nopad(nonce + xor_bytes(plaintext, stream))
+
 
+@lru_cache(maxsize=4096)
+def decrypt_recipe_id(token: str, *, legacy: bool = False) -> str | None:
+    """Дешифрует токен и возвращает recipe_id или None, если не удалось.
 
-def decrypt_recipe_id(token: str) -> str | None:
-    """Дешифрует токен и возвращает recipe_id или None, если не удалось."""
+    legacy=True — токен из старых ссылок на sha256-потоке. Результат — чистая
+    функция токена при неизменном pepper, поэтому повторные переходы по одной
+    популярной ссылке берутся из LRU без base64 и BLAKE2b.
+    """
     try:
         raw = urlsafe_b64decode_padded(token)
         if len(raw) <= TOKEN_NONCE_LEN:
@@ -58,8 +90,11 @@ def decrypt_recipe_id(token: str) -> str | None:
         nonce = raw[:TOKEN_NONCE_LEN]
         ciphertext = raw[TOKEN_NONCE_LEN:]
         pepper = pepper_bytes()
-        stream = derive_keystream(pepper, nonce, len(ciphertext))
-        plaintext = bytes(a ^ b for a, b in zip(ciphertext, stream, strict=False))
+        if legacy:
+            stream = derive_keystream(pepper, nonce, len(ciphertext))
+        else:
+            stream = derive_keyed_keystream(share_key(pepper), nonce, len(ciphertext))
+        plaintext = xor_bytes(ciphertext, stream)
         return plaintext.decode("utf-8").strip()
     except (ValueError, UnicodeDecodeError, binascii.Error):
         return None
@@ -3,11 +3,23 @@ import re
 from aiogram.enums import MessageEntityType
 from aiogram.types import Message
 
-_URL_RE = re.compile(r"(?P<url>https?://(?:www\.)?[^\s<>()\[\]]+)", re.IGNORECASE)
+# Пробелы Unicode, которые \s перестаёт ловить под re.ASCII: граница ссылки та же,
+# а движок не обращается к Unicode-таблицам на каждом символе URL.
+_UNICODE_SPACES = "\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+_URL_RE = re.compile(
+    rf"(?P<url>https?://(?:www\.)?[^\s{_UNICODE_SPACES}<>()\[\]]+)",
+    re.IGNORECASE | re.ASCII,
+)
+# Пунктуация, прилипающая к ссылке в конце предложения.
+_TRAILING_PUNCTUATION = ".,);:!?]»”"
 
 
 def extract_first_url(message: Message) -> str | None:
-    """Возвращает первую ссылку из текста/подписи сообщения, если она есть."""
+    """Возвращает первую ссылку из текста/подписи сообщения, если она есть.
+
+    Сначала смотрим готовые сущности Telegram (URL/TEXT_LINK) — это список
+    объектов, уже лежащий в сообщении; регулярка — только запасной путь.
+    """
     for entities, source_text in (
         (message.entities, message.text),
         (message.caption_entities, message.caption),
@@ -21,5 +33,7 @@ def extract_first_url(message: Message) -> str | None:
                 return entity.extract_from(source_text)
 
     source_text = message.text or message.caption or ""
+    if "://" not in source_text:
+        return None
     match = _URL_RE.search(source_text)
-    return match.group("url").rstrip(".,);:!?]»”") if match else None
+    return match.group("url").rstrip(_TRAILING_PUNCTUATION) if match else None
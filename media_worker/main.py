@@ -36,6 +36,7 @@ async def main() -> None:
     state = AppState(db=db, redis=redis)
 
     notifier = MediaWorkerNotifier(settings.telegram.bot_token.get_secret_value())
+    await notifier.warm_up()
     logger.info("✅ Notifier ready")
 
     logger.info("🚀 media_worker ready, starting tasks")
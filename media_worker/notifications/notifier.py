@@ -1,10 +1,12 @@
 """Отправка сообщений в Telegram из media_worker через aiogram Bot."""
 
+import asyncio
+import contextlib
 import logging
 from pathlib import Path
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
 from aiogram.types import FSInputFile, InlineKeyboardButton, InlineKeyboardMarkup
 
 from packages.common_settings.settings import settings
@@ -18,6 +20,9 @@ from packages.notifications.formatting import (
 
 logger = logging.getLogger(__name__)
 
+# Ошибки правки, после которых прогресс-сообщение уже не отредактировать.
+_EDIT_TARGET_GONE = ("message to edit not found", "message can't be edited")
+
 
 def _save_keyboard(pipeline_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
@@ -31,20 +36,93 @@ def _save_keyboard(pipeline_id: int) -> InlineKeyboardMarkup:
 class MediaWorkerNotifier:
     """Обновляет прогресс-сообщение и отправляет финальную карточку рецепта."""
 
-    def __init__(self, bot_token: str, min_edit_interval: float = 1.0) -> None:
+    def __init__(self, bot_token: str, min_edit_interval: float = 1.5) -> None:
         self._bot = Bot(token=bot_token)
         self._throttle = EditThrottle(min_edit_interval)
+        # Последняя отложенная правка прогресса (chat_id, message_id, text)
+        # и задача, которая отправит её по истечении интервала троттлинга.
+        self._pending_progress: tuple[int, int, str] | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._progress_target: tuple[int, int] | None = None
+        # (chat_id, message_id, pct, label) последнего отправленного/отложенного прогресса.
+        self._last_progress: tuple[int, int, int, str] | None = None
+
+    async def warm_up(self) -> None:
+        """Открыть соединение с Bot API заранее (getMe), чтобы первая правка не ждала TLS-handshake."""
+        try:
+            await self._bot.get_me()
+        except Exception:
+            logger.warning("Не удалось прогреть соединение с Telegram", exc_info=True)
 
     async def close(self) -> None:
+        await self._cancel_progress_flush()
         await self._bot.session.close()
 
     async def edit_progress(self, chat_id: int, message_id: int, pct: int, label: str = "") -> None:
-        """Редактировать прогресс-сообщение с троттлингом."""
-        await self._throttle.wait_async()
+        """Редактировать прогресс-сообщение с троттлингом.
+
+        Если интервал ещё не истёк, правка откладывается: отправится только
+        последнее значение, а вызывающий код не ждёт.
+        """
+        key = (chat_id, message_id, pct, label)
+        if key == self._last_progress:
+            return
         text = format_progress_bar(pct, label)
+        delay = self._throttle.gap()
+        if not delay and self._flush_task is None:
+            # Запоминаем значение только после удачной отправки: при сбое
+            # тот же процент не должен считаться дублем и отбрасываться.
+            await self._edit_progress_now(chat_id, message_id, text)
+            self._last_progress = key
+            return
+        self._last_progress = key
+        self._pending_progress = (chat_id, message_id, text)
+        self._progress_target = (chat_id, message_id)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_progress_later(delay))
+
+    async def _flush_progress_later(self, delay: float) -> None:
+        try:
+            while True:
+                await asyncio.sleep(delay)
+                pending, self._pending_progress = self._pending_progress, None
+                if pending is None:
+                    return
+                try:
+                    await self._edit_progress_now(*pending)
+                except Exception:
+                    logger.warning("Отложенная правка прогресса не удалась", exc_info=True)
+                    if self._pending_progress is None:
+                        self._last_progress = None
+                delay = self._throttle.gap()
+        finally:
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+
+    async def _cancel_progress_flush(self) -> None:
+        """Отменить отложенную правку — сообщение сейчас удалят или заменят ошибкой."""
+        task, self._flush_task = self._flush_task, None
+        self._pending_progress = None
+        self._last_progress = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _edit_progress_now(self, chat_id: int, message_id: int, text: str) -> None:
         try:
             await self._bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=text)
             self._throttle.mark()
+        except TelegramRetryAfter as e:
+            # 429: ставим правки на паузу до retry_after и повторяем последнее значение потом,
+            # иначе каждая новая правка продлевает бан чата.
+            logger.warning("edit_progress: flood control, пауза %s с", e.retry_after)
+            self._throttle.suppress(e.retry_after)
+            if self._pending_progress is None:
+                self._pending_progress = (chat_id, message_id, text)
+                self._progress_target = (chat_id, message_id)
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_progress_later(self._throttle.gap()))
         except TelegramBadRequest as e:
             if "message is not modified" not in str(e).lower():
                 logger.warning("edit_progress: %s", e)
@@ -52,16 +130,24 @@ class MediaWorkerNotifier:
     async def send_error(self, chat_id: int, message_id: int | None, text: str) -> None:
         """Поставить ❌ в прогресс-сообщение (или отправить новое, если id нет)."""
         error_text = format_error_text(text)
-        try:
-            if message_id is not None:
-                await self._bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=error_text)
-            else:
-                await self._bot.send_message(chat_id=chat_id, text=error_text)
-        except Exception:
+        await self._cancel_progress_flush()
+        if message_id is not None:
             try:
-                await self._bot.send_message(chat_id=chat_id, text=error_text)
+                await self._bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=error_text)
+                return
+            except TelegramBadRequest as e:
+                # Новое сообщение нужно, только если старое исчезло или недоступно
+                # для правки; иначе (например, «not modified») получится дубль.
+                msg = str(e).lower()
+                if not any(phrase in msg for phrase in _EDIT_TARGET_GONE):
+                    logger.warning("send_error: %s", e)
+                    return
             except Exception:
-                logger.exception("send_error failed")
+                logger.warning("send_error: не удалось отредактировать сообщение", exc_info=True)
+        try:
+            await self._bot.send_message(chat_id=chat_id, text=error_text)
+        except Exception:
+            logger.exception("send_error failed")
 
     async def send_recipe_card(
         self,
@@ -87,6 +173,8 @@ class MediaWorkerNotifier:
 
     async def delete_message(self, chat_id: int, message_id: int) -> None:
         """Удалить сообщение, игнорируя ошибки (уже удалено / недоступно)."""
+        if self._flush_task is not None and self._progress_target == (chat_id, message_id):
+            await self._cancel_progress_flush()
         try:
             await self._bot.delete_message(chat_id=chat_id, message_id=message_id)
         except TelegramBadRequest as e:
@@ -2,12 +2,14 @@
 
 - нотификации через MediaWorkerNotifier (plain HTTP)
 - draft пишется в Redis чтобы bot-обработчик Save смог найти recipe_id
-- upload видео в канал идёт параллельно с транскрибацией
+- конвертация и upload видео в канал идут параллельно с транскрибацией и AI
 """
 
 import asyncio
 import logging
-from pathlib import Path
+import os
+from collections.abc import Awaitable
+from contextlib import suppress
 
 from redis.asyncio import Redis
 
@@ -19,6 +21,7 @@ from packages.media.audio_extractor import async_extract_audio
 from packages.media.safe_remove import safe_remove
 from packages.media.video_converter import async_convert_to_mp4
 from packages.media.video_downloader import async_download_video_and_description
+from packages.recipes_core.deepseek_parsers import RecipeExtraction
 from packages.recipes_core.services.provider import get_default_extractor
 from packages.redis.data_models import PipelineDraft
 from packages.redis.repository.message_ids import UserMessageIdsCacheRepository
@@ -32,10 +35,24 @@ logger = logging.getLogger(__name__)
 
 
 def _with_pipeline_suffix(path: str, pipeline_id: int) -> str:
-    p = Path(path)
-    if not p.suffix:
-        return f"{path}_{pipeline_id}"
-    return str(p.with_name(f"{p.stem}_{pipeline_id}{p.suffix}"))
+    root, ext = os.path.splitext(path)
+    return f"{root}_{pipeline_id}{ext}"
+
+
+async def _produce_file(work: Awaitable[str | None]) -> str | None:
+    """Дождаться ffmpeg-шага, пишущего файл, даже если ветку отменили.
+
+    asyncio.to_thread не прерывает поток: без ожидания ffmpeg дописал бы файл
+    уже после провала job (и читал бы исходник, который удаляет finally).
+    При отмене результат дожидается и удаляется, затем отмена пробрасывается.
+    """
+    task = asyncio.ensure_future(work)
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        with suppress(Exception):
+            safe_remove(await task)
+        raise
 
 
 async def run(
@@ -50,11 +67,44 @@ async def run(
     user_id = job.user_id
     job_id = job.id
     msg_id = job.progress_message_id
+    shown_pct = 0
 
     async def _progress(pct: int, label: str) -> None:
-        if msg_id is not None:
+        # Ветки идут параллельно и завершаются в любом порядке — прогресс только растёт.
+        nonlocal shown_pct
+        if msg_id is not None and pct > shown_pct:
+            shown_pct = pct
             await notifier.edit_progress(chat_id, msg_id, pct, label)
 
+    async def _convert_and_upload(source_path: str) -> tuple[str, str]:
+        converted = await _produce_file(async_convert_to_mp4(source_path)) or ""
+        try:
+            await _progress(40, "Видео конвертировано")
+            return converted, await notifier.upload_video_to_channel(converted)
+        except asyncio.CancelledError:
+            safe_remove(converted)
+            raise
+        except Exception:
+            logger.warning("job_id=%s upload в канал не удался, продолжаем без file_id", job_id)
+            return converted, ""
+
+    async def _extract_recipe(source_path: str, description: str) -> RecipeExtraction:
+        audio_path = await _produce_file(async_extract_audio(source_path, AUDIO_FOLDER))
+        if not audio_path:
+            raise RuntimeError("Не удалось извлечь аудио из видео")
+        await _progress(55, "Аудио извлечено")
+        try:
+            transcript = await transcribe_async(audio_path)
+        finally:
+            safe_remove(audio_path)
+        await _progress(70, "Речь распознана")
+
+        result = await get_default_extractor().extract(description=description, recognized_text=transcript)
+        if not result.title or not result.instructions_text:
+            raise RuntimeError("AI не смог извлечь рецепт из видео")
+        await _progress(85, "Рецепт готов")
+        return result
+
     try:
         # 1. Скачиваем видео (бросает FatalPipelineError если контент недоступен)
         video_path, description = await async_download_video_and_description(job.url)
@@ -63,34 +113,29 @@ async def run(
         # 2. Переименовываем чтобы избежать коллизий между jobs
         suffixed = _with_pipeline_suffix(video_path, job_id)
         try:
-            Path(video_path).rename(suffixed)
+            os.replace(video_path, suffixed)
             video_path = suffixed
         except Exception as exc:
             logger.warning("Не удалось переименовать %s → %s: %s", video_path, suffixed, exc)
 
-        # 3. Конвертируем в mp4
-        converted_path = await async_convert_to_mp4(video_path)
-        safe_remove(video_path)
-        await _progress(40, "Видео конвертировано")
-
-        # 4. Запускаем upload в канал параллельно с извлечением аудио и транскрибацией
-        upload_task: asyncio.Task[str] = asyncio.create_task(notifier.upload_video_to_channel(converted_path))
-
-        # 5. Извлекаем аудио
-        audio_path = await async_extract_audio(converted_path, AUDIO_FOLDER)
-        if not audio_path:
-            upload_task.cancel()
-            raise RuntimeError("Не удалось извлечь аудио из видео")
-        await _progress(55, "Аудио извлечено")
-
-        # 6. Транскрибируем
-        transcript = await transcribe_async(audio_path)
-        safe_remove(audio_path)
-        await _progress(70, "Речь распознана")
-
-        # 7. Извлекаем рецепт через AI
-        extractor = get_default_extractor()
-        result = await extractor.extract(description=description, recognized_text=transcript)
+        # 3–7. Конвертация + upload в канал и аудио → транскрибация → AI идут параллельно:
+        # аудио читается из исходника и не ждёт конвертацию. Ошибка любой ветки отменяет
+        # вторую (TaskGroup), исходник удаляется в любом случае.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                upload_task = tg.create_task(_convert_and_upload(video_path))
+                extract_task = tg.create_task(_extract_recipe(video_path, description))
+        except ExceptionGroup as eg:
+            for extra in eg.exceptions[1:]:
+                logger.error("job_id=%s: ошибка второй ветки конвейера", job_id, exc_info=extra)
+            if upload_task.done() and not upload_task.cancelled() and upload_task.exception() is None:
+                safe_remove(upload_task.result()[0])
+            raise eg.exceptions[0] from None
+        finally:
+            safe_remove(video_path)
+
+        converted_path, video_file_id = upload_task.result()
+        result = extract_task.result()
         title, recipe = result.title, result.instructions_text
         ingredients = result.ingredients
         ingredient_lines = (
@@ -101,18 +146,6 @@ async def run(
             if ingredients
             else []
         )
-        await _progress(85, "Рецепт готов")
-
-        if not title or not recipe:
-            upload_task.cancel()
-            raise RuntimeError("AI не смог извлечь рецепт из видео")
-
-        # Получаем file_id из upload (если успел — мгновенно, иначе ждём)
-        try:
-            video_file_id: str = await upload_task
-        except Exception:
-            logger.warning("job_id=%s upload в канал не удался, продолжаем без file_id", job_id)
-            video_file_id = ""
 
         if video_file_id:
             safe_remove(converted_path)
@@ -126,25 +159,24 @@ async def run(
             video_url=video_file_id or None,
         )
 
-        # 9. Кладём draft в Redis — bot-обработчик save читает оттуда
+        # 9–10. Кладём draft в Redis (bot-обработчик save читает оттуда) и удаляем
+        # прогресс-сообщение — запросы независимы и идут параллельно. Оба завершаются
+        # до отправки карточки, чтобы кнопка «Сохранить» уже находила черновик.
         draft_repo = PipelineDraftCacheRepository(redis)
-        await draft_repo.set(
-            user_id,
-            job_id,
-            PipelineDraft(
-                original_url=job.url,
-                title=title,
-                recipe=recipe,
-                ingredients=ingredient_lines,
-                recipe_id=recipe_id,
-            ),
+        draft = PipelineDraft(
+            original_url=job.url,
+            title=title,
+            recipe=recipe,
+            ingredients=ingredient_lines,
+            recipe_id=recipe_id,
         )
-
-        # 10. Удаляем прогресс-сообщение перед финальными сообщениями
         if msg_id is not None:
-            await notifier.delete_message(chat_id, msg_id)
+            await asyncio.gather(draft_repo.set(user_id, job_id, draft), notifier.delete_message(chat_id, msg_id))
+        else:
+            await draft_repo.set(user_id, job_id, draft)
 
-        # 12. Отправляем видео и карточку пользователю, трекаем message_id
+        # 12. Отправляем видео и карточку пользователю, трекаем message_id.
+        # Последовательно: параллельная отправка может поставить карточку над видео.
         sent_ids: list[int] = []
 
         if video_file_id:
@@ -42,5 +42,5 @@ class TelethonSettings(BaseAppSettings):
 def get_telethon_settings() -> TelethonSettings:
     """Ленивая загрузка настроек без побочных эффектов при импорте."""
     settings = TelethonSettings()
-    logger.debug(f"Telethon настройки загружены: {settings.safe_dict()}")
+    logger.debug("Telethon настройки загружены: %s", settings.safe_dict())
     return settings
@@ -0,0 +1,51 @@
+"""add full-text search tsvector columns for recipes and ingredients
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "d4e5f6a7b8c9"
+down_revision: str | Sequence[str] | None = "c3d4e5f6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "recipes",
+        sa.Column(
+            "title_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('russian', title)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_recipes_title_tsv", "recipes", ["title_tsv"], unique=False, postgresql_using="gin")
+
+    op.add_column(
+        "ingredients",
+        sa.Column(
+            "name_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('russian', name)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_ingredients_name_tsv", "ingredients", ["name_tsv"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ingredients_name_tsv", table_name="ingredients")
+    op.drop_column("ingredients", "name_tsv")
+    op.drop_index("ix_recipes_title_tsv", table_name="recipes")
+    op.drop_column("recipes", "title_tsv")
@@ -3,6 +3,7 @@ from decimal import Decimal
 
 from sqlalchemy import (
     BigInteger,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -12,7 +13,9 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -22,9 +25,22 @@ class Recipe(Base):
     """Модель рецепта."""
 
     __tablename__ = "recipes"
+    __table_args__ = (
+        Index("ix_recipes_title_tsv", "title_tsv", postgresql_using="gin"),
+        Index(
+            "ix_recipes_title_trgm",
+            func.lower(text("title")).label("title_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"title_lower": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(2000), nullable=False, index=True)
+    # Полнотекстовый индекс по названию (русская морфология); считается самой БД, ORM его не грузит.
+    title_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('russian', title)", persisted=True), deferred=True
+    )
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -77,9 +93,21 @@ class Ingredient(Base):
     """Модель ингредиента."""
 
     __tablename__ = "ingredients"
+    __table_args__ = (
+        Index("ix_ingredients_name_tsv", "name_tsv", postgresql_using="gin"),
+        Index(
+            "ix_ingredients_name_trgm",
+            func.lower(text("name")).label("name_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"name_lower": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(300), nullable=False, unique=True, index=True)
+    name_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('russian', name)", persisted=True), deferred=True
+    )
 
     recipes: Mapped[list["Recipe"]] = relationship(
         secondary="recipe_ingredients",
@@ -348,6 +348,19 @@ class BroadcastRepository(SessionMixin):
             )
         )
 
+    async def release_message(self, *, message_id: int, next_retry_at: datetime) -> None:
+        """Вернуть захваченное, но не отправленное сообщение в retry, не тратя попытку."""
+        await self.session.execute(
+            update(BroadcastMessage)
+            .where(BroadcastMessage.id == int(message_id))
+            .values(
+                status=BroadcastMessageStatus.retry,
+                next_retry_at=next_retry_at,
+                locked_until=None,
+                attempts=func.greatest(BroadcastMessage.attempts - 1, 0),
+            )
+        )
+
     async def complete_finished_campaigns(self, *, limit: int = 50) -> None:
         """Закрыть running-кампании, у которых не осталось необработанных сообщений."""
         now = datetime.now(UTC)
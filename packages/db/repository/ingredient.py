@@ -1,6 +1,6 @@
 from collections.abc import Iterable
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import String, column, delete, func, select, union_all, update, values
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
@@ -61,30 +61,33 @@ class IngredientRepository(BaseRepository[Ingredient]):
 
         uniq = list(dict.fromkeys(norm))
 
-        rows = await self.session.execute(select(self.model.id, self.model.name).where(self.model.name.in_(uniq)))
-        existing = {name: _id for _id, name in rows.all()}
-
-        to_insert = [n for n in uniq if n not in existing]
-        inserted: dict[str, int] = {}
-
-        if to_insert:
-            stmt = (
-                pg_insert(self.model)
-                .values([{"name": n} for n in to_insert])
-                .on_conflict_do_nothing(index_elements=[self.model.name])
-                .returning(self.model.id, self.model.name)
+        # Выборка существующих и вставка недостающих — одним запросом (data-modifying CTE).
+        # Вставляются только имена, которых нет в existing, поэтому sequence не расходуется зря.
+        existing = select(self.model.id, self.model.name).where(self.model.name.in_(uniq)).cte("existing")
+        requested = values(column("name", String), name="requested").data([(n,) for n in uniq])
+        inserted = (
+            pg_insert(self.model)
+            .from_select(
+                ["name"],
+                select(requested.c.name).where(requested.c.name.not_in(select(existing.c.name))),
             )
-            res = await self.session.execute(stmt)
-            inserted = {name: _id for _id, name in res.all()}
+            .on_conflict_do_nothing(index_elements=[self.model.name])
+            .returning(self.model.id, self.model.name)
+            .cte("inserted")
+        )
+        rows = await self.session.execute(
+            union_all(select(existing.c.id, existing.c.name), select(inserted.c.id, inserted.c.name))
+        )
+        result = {name: _id for _id, name in rows.all()}
 
-            missing = [n for n in to_insert if n not in inserted]
-            if missing:
-                res2 = await self.session.execute(
-                    select(self.model.id, self.model.name).where(self.model.name.in_(missing))
-                )
-                inserted.update({name: _id for _id, name in res2.all()})
+        # Имена, вставленные параллельной транзакцией после снимка запроса: их нет ни в existing,
+        # ни в RETURNING (ON CONFLICT DO NOTHING) — дочитываем отдельно.
+        missing = [n for n in uniq if n not in result]
+        if missing:
+            res = await self.session.execute(select(self.model.id, self.model.name).where(self.model.name.in_(missing)))
+            result.update({name: _id for _id, name in res.all()})
 
-        return {**existing, **inserted}
+        return result
 
     async def delete_orphans(self, ingredient_ids: Iterable[int]) -> int:
         """Удалить из переданных id те ингредиенты, на которые не осталось ни одной связи. Вернуть число удалённых."""
@@ -1,7 +1,20 @@
 import logging
 
-from sqlalchemy import and_, asc, case, desc, func, or_, select, update
-from sqlalchemy.orm import joinedload
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    asc,
+    case,
+    cast,
+    desc,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import QueryableAttribute, joinedload, raiseload
 
 from packages.db.models import Ingredient, Recipe, RecipeIngredient, RecipeUser, Video
 from packages.db.schemas import RecipeCreate, RecipeUpdate
@@ -11,6 +24,22 @@ from .recipe_user import RecipeUserRepository
 
 logger = logging.getLogger(__name__)
 
+# Конфигурация полнотекстового поиска — должна совпадать с generated-колонками *_tsv.
+SEARCH_TS_CONFIG = "russian"
+
+
+def _ts_query(query: str):
+    """tsquery из пользовательского ввода (синтаксис websearch: слова, "фразы", -исключения)."""
+    return func.websearch_to_tsquery(cast(SEARCH_TS_CONFIG, REGCONFIG), query)
+
+
+def _text_match(tsv_column: QueryableAttribute, text_column: QueryableAttribute, query: str) -> ColumnElement[bool]:
+    """Совпадение по FTS (словоформы) или по подстроке в lower(text) (trigram GIN, частичные слова)."""
+    return or_(
+        tsv_column.bool_op("@@")(_ts_query(query)),
+        func.lower(text_column).contains(query.lower(), autoescape=True),
+    )
+
 
 class RecipeRepository(BaseRepository[Recipe]):
     """Репозиторий для работы с рецептами."""
@@ -49,7 +78,7 @@ class RecipeRepository(BaseRepository[Recipe]):
         )
         result = await self.session.execute(statement)
         row = result.scalar_one_or_none()
-        logger.debug(f"Рецепт {recipe_id} обновлён: category_id={category_id}, row={row}")
+        logger.debug("Рецепт %s обновлён: category_id=%s, row=%s", recipe_id, category_id, row)
         if row is None:
             raise ValueError("Рецепт не найден")
         return await self.get_name_by_id(recipe_id)
@@ -57,7 +86,7 @@ class RecipeRepository(BaseRepository[Recipe]):
     async def update_title(self, recipe_id: int, title: str) -> None:
         """Обновить заголовок рецепта."""
         await self.update_fields(recipe_id, {"title": title})
-        logger.debug(f"Название рецепта {recipe_id} обновлено на: {title}")
+        logger.debug("Название рецепта %s обновлено на: %s", recipe_id, title)
 
     async def update_last_used_at(self, recipe_id: int) -> None:
         """Обновить метку последнего использования рецепта на текущее время."""
@@ -84,6 +113,17 @@ class RecipeRepository(BaseRepository[Recipe]):
         )
         return await fetch_all(self.session, statement)
 
+    async def get_random_id_by_category(self, user_id: int, category_id: int) -> int | None:
+        """Вернуть id случайного рецепта пользователя в категории (ORDER BY random() LIMIT 1)."""
+        statement = (
+            select(self.model.id)
+            .join(RecipeUser, RecipeUser.recipe_id == self.model.id)
+            .where(RecipeUser.user_id == user_id, RecipeUser.category_id == category_id)
+            .order_by(func.random())
+            .limit(1)
+        )
+        return (await self.session.execute(statement)).scalar_one_or_none()
+
     async def get_with_category_for_user(self, recipe_id: int, user_id: int) -> tuple[Recipe, int] | None:
         """Загрузить рецепт пользователя с ингредиентами и видео. Возвращает (recipe, category_id) или None."""
         stmt = (
@@ -102,15 +142,29 @@ class RecipeRepository(BaseRepository[Recipe]):
         return row[0], int(row[1])
 
     async def get_recipe_with_connections(self, recipe_id: int) -> Recipe | None:
-        """Загрузить рецепт вместе с ингредиентами (с qty/unit) и видео."""
-        statement = (
-            select(self.model)
+        """Загрузить рецепт вместе с ингредиентами (с qty/unit) и видео — одним запросом.
+
+        Остальные связи (по умолчанию lazy="selectin") не грузятся: карточке они не
+        нужны, а обращение к ним упадёт сразу, а не неявным запросом под asyncio.
+        """
+        statement = select(self.model).where(self.model.id == recipe_id).options(*self._card_options())
+        result = await self.session.execute(statement)
+        return result.unique().scalars().one_or_none()
+
+    async def touch_and_get_with_connections(self, recipe_id: int) -> Recipe | None:
+        """get_recipe_with_connections() + отметка last_used_at — одним запросом.
+
+        UPDATE идёт data-modifying CTE, SELECT джойнится к его RETURNING. SELECT видит
+        снимок до UPDATE, поэтому last_used_at у возвращённого объекта — прежний.
+        """
+        touched = (
+            update(self.model)
             .where(self.model.id == recipe_id)
-            .options(
-                self._ingredient_links_option(),
-                joinedload(self.model.video),
-            )
+            .values(last_used_at=func.now())
+            .returning(self.model.id)
+            .cte("touched")
         )
+        statement = select(self.model).join(touched, touched.c.id == self.model.id).options(*self._card_options())
         result = await self.session.execute(statement)
         return result.unique().scalars().one_or_none()
 
@@ -164,30 +218,63 @@ class RecipeRepository(BaseRepository[Recipe]):
         )
         return await fetch_all(self.session, statement)
 
-    async def search_recipes_by_title(self, user_id: int, query: str) -> list[Recipe]:
-        """Найти рецепты пользователя по подстроке в названии (ilike)."""
-        pattern = f"%{query}%"
+    async def search_page_by_title(
+        self,
+        user_id: int,
+        query: str,
+        *,
+        limit: int,
+        after_id: int = 0,
+        before_id: int = 0,
+    ) -> list[tuple[int, str]]:
+        """Страница (id, title) рецептов пользователя по названию (FTS + подстрока, keyset по id)."""
         statement = (
-            select(self.model)
+            select(self.model.id, self.model.title)
             .join(RecipeUser, RecipeUser.recipe_id == self.model.id)
-            .where(RecipeUser.user_id == user_id, self.model.title.ilike(pattern))
-            .order_by(self.model.id)
+            .where(RecipeUser.user_id == user_id, _text_match(self.model.title_tsv, self.model.title, query))
         )
-        return await fetch_all(self.session, statement)
+        return await self._fetch_keyset_page(statement, limit=limit, after_id=after_id, before_id=before_id)
 
-    async def search_recipes_by_ingredient(self, user_id: int, query: str) -> list[Recipe]:
-        """Найти рецепты пользователя по подстроке в названии ингредиента (ilike)."""
-        pattern = f"%{query}%"
+    async def search_page_by_ingredient(
+        self,
+        user_id: int,
+        query: str,
+        *,
+        limit: int,
+        after_id: int = 0,
+        before_id: int = 0,
+    ) -> list[tuple[int, str]]:
+        """Страница (id, title) рецептов пользователя по ингредиенту (FTS + подстрока, keyset по id)."""
         statement = (
-            select(self.model)
+            select(self.model.id, self.model.title)
             .join(RecipeUser, RecipeUser.recipe_id == self.model.id)
             .join(RecipeIngredient, RecipeIngredient.recipe_id == self.model.id)
             .join(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
-            .where(RecipeUser.user_id == user_id, Ingredient.name.ilike(pattern))
+            .where(RecipeUser.user_id == user_id, _text_match(Ingredient.name_tsv, Ingredient.name, query))
             .distinct()
-            .order_by(self.model.id)
         )
-        return await fetch_all(self.session, statement)
+        return await self._fetch_keyset_page(statement, limit=limit, after_id=after_id, before_id=before_id)
+
+    async def _fetch_keyset_page(
+        self,
+        statement: Select,
+        *,
+        limit: int,
+        after_id: int,
+        before_id: int,
+    ) -> list[tuple[int, str]]:
+        """Keyset-пагинация по id без OFFSET: строки после after_id или перед before_id, по возрастанию id."""
+        if before_id:
+            statement = statement.where(self.model.id < before_id).order_by(desc(self.model.id))
+        else:
+            statement = statement.where(self.model.id > after_id).order_by(asc(self.model.id))
+        rows = (await self.session.execute(statement.limit(limit))).all()
+        page = [(int(row.id), str(row.title)) for row in rows]
+        return page[::-1] if before_id else page
+
+    async def get_basic(self, recipe_id: int) -> Recipe | None:
+        """Рецепт по id без связей (только название/описание и служебные поля)."""
+        return await self.session.get(self.model, recipe_id, options=[raiseload("*")])
 
     async def get_name_by_id(self, recipe_id: int) -> str | None:
         """Вернуть название рецепта по id."""
@@ -289,8 +376,17 @@ class RecipeRepository(BaseRepository[Recipe]):
         rows = (await self.session.execute(stmt)).all()
         return {rid: (int(f), int(t)) for rid, f, t in rows}
 
+    def _card_options(self) -> tuple:
+        """Связи карточки рецепта: ингредиенты и видео; остальные не грузятся."""
+        return self._ingredient_links_option(), joinedload(self.model.video), raiseload("*")
+
     def _ingredient_links_option(self):
-        return joinedload(self.model.ingredient_links).joinedload(RecipeIngredient.ingredient)
+        # Ingredient.recipes (selectin) подтянул бы все рецепты с этим ингредиентом — отключаем.
+        return (
+            joinedload(self.model.ingredient_links)
+            .joinedload(RecipeIngredient.ingredient)
+            .raiseload(Ingredient.recipes)
+        )
 
     @staticmethod
     def _recipe_fill_subq():
@@ -6,12 +6,18 @@ import random
 from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from packages.enums import BroadcastFailureKind as FailureKind
 
 if TYPE_CHECKING:
     from packages.db.models.broadcast import BroadcastCampaign
 
+# Общий keep-alive пул к api.telegram.org: вызовы идут из потоков asyncio.to_thread,
+# и без Session каждый из них открывал новое TCP+TLS-соединение.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
 _BACKOFF_BASE_SEC = 30.0
 _BACKOFF_MAX_SEC = 3600.0
 _BACKOFF_JITTER_SEC = 5.0
@@ -86,7 +92,7 @@ async def tg_call(method: str, payload: dict[str, Any], *, bot_token: str, timeo
     url = f"https://api.telegram.org/bot{bot_token}/{method}"
 
     def _call() -> dict[str, Any]:
-        r = requests.post(url, json=payload, timeout=timeout)
+        r = _http.post(url, json=payload, timeout=timeout)
         try:
             data = r.json()
         except Exception:
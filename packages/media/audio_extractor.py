@@ -52,13 +52,13 @@ def extract_audio(video_path: str, output_folder: str) -> str | None:
         "1",
         audio_path,
     ]
-    logger.debug(f"Извлечение аудио из {video_path} в {audio_path}")
+    logger.debug("Извлечение аудио из %s в %s", video_path, audio_path)
     try:
         subprocess.run(command, check=True)
     except subprocess.CalledProcessError as exc:
         logger.error(f"Не удалось извлечь аудио из {video_path}: {exc}")
         return None
-    logger.debug(f"Аудио успешно извлечено в {audio_path}")
+    logger.debug("Аудио успешно извлечено в %s", audio_path)
     return audio_path
 
 
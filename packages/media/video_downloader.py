@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 def _ensure_dir(path: str) -> None:
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
-        logger.debug(f"📁 Папка для видео создана: {path}")
+        logger.debug("📁 Папка для видео создана: %s", path)
 
 
 def download_video_and_description(url: str) -> tuple[str, str]:
@@ -31,7 +31,7 @@ def download_video_and_description(url: str) -> tuple[str, str]:
         description = payload.get("description") or ""
         if not file_path:
             raise FatalPipelineError("Сервис downloader вернул пустой путь к файлу")
-        logger.debug(f"✅ Сервис downloader вернул файл: {file_path}")
+        logger.debug("✅ Сервис downloader вернул файл: %s", file_path)
         return file_path, description
     except FatalPipelineError:
         raise
@@ -14,21 +14,26 @@ class EditThrottle:
         self._min_interval = min_interval
         self._last_ts: float = 0.0
 
-    def _gap(self) -> float:
+    def gap(self) -> float:
+        """Сколько секунд осталось до момента, когда правка разрешена."""
         return max(0.0, self._min_interval - (time.monotonic() - self._last_ts))
 
     def wait_sync(self) -> None:
         """Синхронная пауза перед правкой."""
-        gap = self._gap()
+        gap = self.gap()
         if gap:
             time.sleep(gap)
 
     async def wait_async(self) -> None:
         """Асинхронная пауза перед правкой."""
-        gap = self._gap()
+        gap = self.gap()
         if gap:
             await asyncio.sleep(gap)
 
+    def suppress(self, seconds: float) -> None:
+        """Запретить правки на seconds (Telegram ответил 429 с retry_after)."""
+        self._last_ts = max(self._last_ts, time.monotonic() + seconds - self._min_interval)
+
     def mark(self) -> None:
         """Зафиксировать момент успешной правки."""
         self._last_ts = time.monotonic()
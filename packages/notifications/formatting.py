@@ -7,6 +7,9 @@
 from html import escape
 from typing import Any
 
+# Всего 11 вариантов полосы (0..10 делений) — строим их один раз.
+_PROGRESS_BARS: tuple[str, ...] = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
 
 def format_error_text(text: str) -> str:
     return f"❌ {text}"
@@ -15,10 +18,10 @@ def format_error_text(text: str) -> str:
 def format_progress_bar(pct: int, label: str = "") -> str:
     """Текстовый прогресс-бар: '▶️ Прогресс: 40% [████░░░░░░] — label'."""
     pct = max(0, min(100, pct))
-    filled = int(round(pct / 10))
-    bar = "█" * filled + "░" * (10 - filled)
-    suffix = f" — {label}" if label else ""
-    return f"▶️ Прогресс: {pct}% [{bar}]{suffix}"
+    bar = _PROGRESS_BARS[round(pct / 10)]
+    if label:
+        return f"▶️ Прогресс: {pct}% [{bar}] — {label}"
+    return f"▶️ Прогресс: {pct}% [{bar}]"
 
 
 def format_recipe_html(
@@ -28,9 +31,9 @@ def format_recipe_html(
 ) -> str:
     """HTML-карточка рецепта для sendMessage / editMessageText."""
     if isinstance(ingredients, list):
-        ing_block = "\n".join(f"• {escape(i)}" for i in ingredients)
+        ing_block = "\n".join(["• " + escape(i if isinstance(i, str) else str(i)) for i in ingredients if i]) or "—"
     else:
-        ing_block = escape(str(ingredients))
+        ing_block = escape(str(ingredients).strip()) or "—"
 
     return (
         f"<b>{escape(title)}</b>\n\n" f"<b>Ингредиенты:</b>\n{ing_block}\n\n" f"<b>Приготовление:</b>\n{escape(recipe)}"
@@ -4,12 +4,18 @@
 """
 
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Строка вида «- имя»: отступ, маркер «- », имя без пробелов по краям (\r от CRLF тоже отрезается).
+_BULLET_LINE_RE = re.compile(r"^[^\S\n]*- [^\S\n]*(\S(?:.*\S)?)", re.MULTILINE)
+
 
 def to_ingredient_name(x: object) -> str:
     """Извлекает строковое имя ингредиента из dict или строки."""
+    if type(x) is str:
+        return x.strip()
     if isinstance(x, dict):
         return (x.get("name") or "").strip()
     return str(x or "").strip()
@@ -17,19 +23,8 @@ def to_ingredient_name(x: object) -> str:
 
 def parse_ingredients(text: str) -> list:
     """Разбирает текст с маркированным списком ингредиентов (- item) в список строк."""
-    logger.debug("Начинаем парсинг ингредиентов...")
-    lines: list = text.strip().split("\n")
-    ingredients: list = []
-
-    for line_number, line in enumerate(lines, 1):
-        logger.debug(f"Обрабатываем строку {line_number}: {line}")
-        stripped_line: str = line.strip()
-        if stripped_line.startswith("- "):
-            ingredient_name: str = stripped_line[2:].strip()
-            if ingredient_name:
-                ingredients.append(ingredient_name)
-
-    logger.debug(f"Парсинг завершен. Найдено ингредиентов: {len(ingredients)}")
+    ingredients = _BULLET_LINE_RE.findall(text)
+    logger.debug("Парсинг завершен. Найдено ингредиентов: %s", len(ingredients))
     return ingredients
 
 
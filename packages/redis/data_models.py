@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(slots=True)
@@ -64,3 +64,57 @@ class PipelineDraft:
         if self.recipe_id is not None:
             data["recipe_id"] = self.recipe_id
         return data
+
+
+def _optional_id(value: object) -> int | None:
+    """Telegram id из Redis-значения (chat_id бывает отрицательным) или None для пустых/невалидных."""
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        return None
+    try:
+        return int(value) or None
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class UrlCandidateState:
+    """Состояние выбора рецепта из нескольких кандидатов, найденных по одной ссылке."""
+
+    url: str | None = None
+    recipe_ids: list[int] = field(default_factory=list)
+    chat_id: int | None = None
+    list_message_id: int | None = None
+    video_message_id: int | None = None
+    recipe_message_id: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> UrlCandidateState | None:
+        """Строит состояние из Redis-словаря; recipe_ids — валидные id без дублей, в исходном порядке."""
+        if not isinstance(data, dict):
+            return None
+        raw_ids = data.get("recipe_ids")
+        recipe_ids = [
+            int(value)
+            for value in (raw_ids if isinstance(raw_ids, list) else [])
+            if isinstance(value, int | str) and str(value).isdigit()
+        ]
+        return cls(
+            url=str(data["url"]) if data.get("url") is not None else None,
+            recipe_ids=list(dict.fromkeys(recipe_ids)),
+            chat_id=_optional_id(data.get("chat_id")),
+            list_message_id=_optional_id(data.get("list_message_id")),
+            video_message_id=_optional_id(data.get("video_message_id")),
+            recipe_message_id=_optional_id(data.get("recipe_message_id")),
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        """Преобразует состояние в словарь для записи в Redis."""
+        return {
+            "url": self.url,
+            "recipe_ids": self.recipe_ids,
+            "chat_id": self.chat_id,
+            "list_message_id": self.list_message_id,
+            "video_message_id": self.video_message_id,
+            "recipe_message_id": self.recipe_message_id,
+            "v": 1,
+        }
@@ -32,6 +32,16 @@ class RedisKeys:
     def user_recipes_ids_and_titles(cls, user_id: int | str, category_id: int | str) -> str:
         return f"{cls.PREFIX}:user:{user_id}:category" f":{category_id}:recipes_ids_titles"
 
+    @classmethod
+    def user_book_recipes(cls, user_id: int | str) -> str:
+        """HASH списков «Книги рецептов» для пользователя (поле — category_id)."""
+        return f"{cls.PREFIX}:user:{user_id}:book_recipes"
+
+    @classmethod
+    def user_search_pages(cls, user_id: int | str) -> str:
+        """HASH закэшированных страниц поиска пользователя (поле — тип/запрос/курсор)."""
+        return f"{cls.PREFIX}:user:{user_id}:search_pages"
+
     @classmethod
     def user_last_recipe_messages(cls, user_id: int | str) -> str:
         return f"{cls.PREFIX}:user:{user_id}:last_recipe_messages"
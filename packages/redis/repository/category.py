@@ -1,6 +1,7 @@
-import json
 import logging
 
+import orjson
+
 from packages.redis.repository.base import BaseRedisRepository
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,7 @@ class CategoryCacheRepository(BaseRedisRepository):
         if raw is None:
             return None
         try:
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             if isinstance(data, list) and all(isinstance(x, dict) for x in data):
                 return data
         except Exception:
@@ -23,7 +24,7 @@ class CategoryCacheRepository(BaseRedisRepository):
 
     async def set_user_categories(self, user_id: int, items: list[dict[str, int | str]]) -> None:
         """Сохраняет список категорий пользователя в Redis с TTL."""
-        payload = json.dumps(items, ensure_ascii=False)
+        payload = orjson.dumps(items)
         await self.redis.setex(self.keys.user_categories(user_id), self.ttl.USER_CATEGORIES, payload)
 
     async def invalidate_user_categories(self, user_id: int) -> None:
@@ -36,22 +37,22 @@ class CategoryCacheRepository(BaseRedisRepository):
         if raw is None:
             return None
         try:
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             if isinstance(data, list) and all(isinstance(x, dict) for x in data):
                 return data
         except Exception:
             await self.redis.delete(self.keys.all_category())
-            logger.debug(f"❌ Запись {self.keys.all_category()} битая, удалена")
+            logger.debug("❌ Запись %s битая, удалена", self.keys.all_category())
             return None
         return None
 
     async def set_all_categories(self, items: list[dict[str, int | str]]) -> None:
         """Сохраняет список всех категорий в Redis с TTL."""
-        payload = json.dumps(items, ensure_ascii=False)
+        payload = orjson.dumps(items)
         await self.redis.setex(self.keys.all_category(), self.ttl.CATEGORY, payload)
-        logger.debug(f"✅ Запись {self.keys.all_category()} сохранена в кэш")
+        logger.debug("✅ Запись %s сохранена в кэш", self.keys.all_category())
 
     async def invalidate_all_categories(self) -> None:
         """Удаляет кэш всех категорий."""
         await self.redis.delete(self.keys.all_category())
-        logger.debug(f"❌ Запись {self.keys.all_category()} удалена из кэша")
+        logger.debug("❌ Запись %s удалена из кэша", self.keys.all_category())
@@ -1,8 +1,31 @@
 import json
 
 from packages.redis.data_models import UserMessageIds
+from packages.redis.lock_repository import maybe_await
 from packages.redis.repository.base import BaseRedisRepository
 
+# Дописывает id в {"chat_id": <id>, "message_ids": [...]}: значение разбирается cjson,
+# так что формат записи (разделители, сериализатор) не важен. Другой чат или битое
+# значение — перезапись. chat_id вставляется строкой из ARGV: cjson.encode печатает
+# числа с 14 значащими цифрами, а id чатов бывают длиннее.
+_APPEND_MESSAGE_IDS_SCRIPT = """
+local ids = cjson.decode(ARGV[3])
+local raw = redis.call("get", KEYS[1])
+if raw then
+  local ok, stored = pcall(cjson.decode, raw)
+  if ok and type(stored) == "table" and stored.chat_id == tonumber(ARGV[1])
+      and type(stored.message_ids) == "table" then
+    local merged = stored.message_ids
+    for _, id in ipairs(ids) do
+      merged[#merged + 1] = id
+    end
+    ids = merged
+  end
+end
+local payload = '{"chat_id": ' .. ARGV[1] .. ', "message_ids": ' .. cjson.encode(ids) .. '}'
+return redis.call("setex", KEYS[1], tonumber(ARGV[2]), payload)
+"""
+
 
 class UserMessageIdsCacheRepository(BaseRedisRepository):
 
@@ -27,15 +50,24 @@ class UserMessageIdsCacheRepository(BaseRedisRepository):
         return None
 
     async def append_user_message_ids(self, user_id: int, chat_id: int, message_ids: list[int]) -> None:
-        """Добавляет message_ids к существующим для пользователя."""
-        existing = await self.get_user_message_ids(user_id)
-        if existing and existing.chat_id == int(chat_id):
-            ids = [int(i) for i in existing.message_ids if isinstance(i, int)]
-        else:
-            ids = []
-        ids.extend([int(i) for i in message_ids if isinstance(i, int)])
-        payload = json.dumps({"chat_id": int(chat_id), "message_ids": ids}, ensure_ascii=False)
-        await self.redis.setex(self.keys.user_last_recipe_messages(user_id), self.ttl.LAST_RECIPE_MESSAGES, payload)
+        """Добавляет message_ids к существующим для пользователя.
+
+        Чтение и запись — один EVAL: без отдельного GET перед SETEX и без гонки
+        между параллельными апдейтами пользователя.
+        """
+        ids = [int(i) for i in message_ids if isinstance(i, int)]
+        if not ids:
+            return
+        await maybe_await(
+            self.redis.eval(
+                _APPEND_MESSAGE_IDS_SCRIPT,
+                1,
+                self.keys.user_last_recipe_messages(user_id),
+                str(int(chat_id)),
+                str(self.ttl.LAST_RECIPE_MESSAGES),
+                json.dumps(ids),
+            )
+        )
 
     async def set_user_message_ids(self, user_id: int, chat_id: int, message_ids: list[int]) -> None:
         """Перезаписывает message_ids пользователя."""
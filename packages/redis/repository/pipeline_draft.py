@@ -4,6 +4,10 @@ from packages.redis.data_models import PipelineDraft
 from packages.redis.lock_repository import maybe_await
 from packages.redis.repository.base import BaseRedisRepository
 
+# Сколько черновиков пайплайна держим на пользователя: TTL индекса продлевается
+# каждой загрузкой, и без лимита множество id у активного пользователя только растёт.
+MAX_PIPELINE_DRAFTS_PER_USER = 16
+
 
 class PipelineDraftCacheRepository(BaseRedisRepository):
 
@@ -19,23 +23,40 @@ class PipelineDraftCacheRepository(BaseRedisRepository):
             return None
 
     async def set(self, user_id: int, pipeline_id: int, payload: PipelineDraft | dict) -> None:
-        """Сохраняет черновик пайплайна."""
+        """Сохраняет черновик пайплайна.
+
+        Запись, индекс и его TTL уходят одним pipeline; если индекс превысил
+        MAX_PIPELINE_DRAFTS_PER_USER, самые старые черновики (pipeline_id —
+        автоинкремент задачи) удаляются.
+        """
         if isinstance(payload, PipelineDraft):
             payload = payload.to_dict()
         value = json.dumps(payload, ensure_ascii=False)
-        await self.redis.setex(
-            self.keys.user_pipeline_draft(user_id, pipeline_id),
-            self.ttl.PIPELINE_DRAFT,
-            value,
-        )
-        await maybe_await(self.redis.sadd(self.keys.user_pipeline_ids(user_id), pipeline_id))
-        await maybe_await(self.redis.expire(self.keys.user_pipeline_ids(user_id), self.ttl.PIPELINE_DRAFT))
+        ids_key = self.keys.user_pipeline_ids(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.setex(self.keys.user_pipeline_draft(user_id, pipeline_id), self.ttl.PIPELINE_DRAFT, value)
+        pipe.sadd(ids_key, pipeline_id)
+        pipe.expire(ids_key, self.ttl.PIPELINE_DRAFT)
+        pipe.scard(ids_key)
+        *_, count = await pipe.execute()
+        if int(count) > MAX_PIPELINE_DRAFTS_PER_USER:
+            await self._evict_oldest(user_id, int(count) - MAX_PIPELINE_DRAFTS_PER_USER)
 
     async def delete(self, user_id: int, pipeline_id: int) -> None:
         """Удаляет черновик пайплайна."""
         await self.redis.delete(self.keys.user_pipeline_draft(user_id, pipeline_id))
         await maybe_await(self.redis.srem(self.keys.user_pipeline_ids(user_id), pipeline_id))
 
+    async def _evict_oldest(self, user_id: int, excess: int) -> None:
+        """Удаляет excess самых старых черновиков пользователя вместе с их id в индексе."""
+        stale = sorted(await self.list_ids(user_id))[:excess]
+        if not stale:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.delete(*(self.keys.user_pipeline_draft(user_id, pipeline_id) for pipeline_id in stale))
+        pipe.srem(self.keys.user_pipeline_ids(user_id), *stale)
+        await pipe.execute()
+
     async def list_ids(self, user_id: int) -> list[int]:
         """Возвращает список активных pipeline_id пользователя."""
         raw = await maybe_await(self.redis.smembers(self.keys.user_pipeline_ids(user_id)))
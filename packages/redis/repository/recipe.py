@@ -1,6 +1,7 @@
-import json
 import logging
 
+import orjson
+
 from packages.redis.repository.base import BaseRedisRepository
 
 logger = logging.getLogger(__name__)
@@ -25,11 +26,11 @@ class RecipeCacheRepository(BaseRedisRepository):
     async def get_all_by_user_and_category(self, user_id: int, category_id: int) -> list[dict[str, int | str]] | None:
         """Вернёт список (id, title) всех рецептов пользователя из Redis или None, если кэша нет."""
         raw = await self.redis.get(self.keys.user_recipes_ids_and_titles(user_id, category_id))
-        logger.debug(f"👉 Строка для Redis: {raw}")
+        logger.debug("👉 Строка для Redis: %s", raw)
         if raw is None:
             return None
         try:
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             if isinstance(data, list) and all(isinstance(x, dict) for x in data):
                 return data
         except Exception:
@@ -43,7 +44,7 @@ class RecipeCacheRepository(BaseRedisRepository):
         items: list[dict[str, object]],
     ) -> None:
         """Сохраняет список (id, title) всех рецептов пользователя в Redis с TTL."""
-        payload = json.dumps(items, ensure_ascii=False)
+        payload = orjson.dumps(items)
         await self.redis.setex(
             self.keys.user_recipes_ids_and_titles(user_id, category_id),
             self.ttl.USER_RECIPES_IDS_AND_TITLES,
@@ -53,4 +54,69 @@ class RecipeCacheRepository(BaseRedisRepository):
     async def invalidate_all_recipes_ids_and_titles(self, user_id: int, category_id: int) -> None:
         """Удаляет кэш списка (id, title) всех рецептов пользователя."""
         await self.redis.delete(self.keys.user_recipes_ids_and_titles(user_id, category_id))
-        logger.debug(f"❌ Удален кэш рецептов пользователя {user_id}")
+        logger.debug("❌ Удален кэш рецептов пользователя %s", user_id)
+
+    async def invalidate_user_recipes(self, user_id: int, category_id: int) -> None:
+        """Одним DEL удаляет счётчик, список категории и страницы поиска пользователя."""
+        await self.redis.delete(
+            self.keys.recipe_count(user_id=user_id),
+            self.keys.user_recipes_ids_and_titles(user_id, category_id),
+            self.keys.user_search_pages(user_id),
+            self.keys.user_book_recipes(user_id),
+        )
+
+    async def invalidate_recipe_titles(self, user_id: int, category_id: int) -> None:
+        """Одним DEL удаляет всё, где видны названия рецептов: список категории, поиск и книгу."""
+        await self.redis.delete(
+            self.keys.user_recipes_ids_and_titles(user_id, category_id),
+            self.keys.user_search_pages(user_id),
+            self.keys.user_book_recipes(user_id),
+        )
+
+    async def get_book_recipes(self, user_id: int, category_id: int) -> list[tuple[int, str]] | None:
+        """Вернёт (id, title) рецептов книги для пользователя или None, если кэша нет."""
+        raw = await self.redis.hget(self.keys.user_book_recipes(user_id), str(category_id))
+        if raw is None:
+            return None
+        try:
+            data = orjson.loads(raw)
+            ids, titles = data["ids"], data["titles"]
+            if isinstance(ids, list) and isinstance(titles, list) and len(ids) == len(titles):
+                return list(zip(ids, titles, strict=True))
+        except Exception:
+            pass
+        return None
+
+    async def set_book_recipes(self, user_id: int, category_id: int, items: list[tuple[int, str]]) -> None:
+        """Сохраняет (id, title) рецептов книги колонками (ids/titles) — компактнее списка словарей."""
+        key = self.keys.user_book_recipes(user_id)
+        payload = {"ids": [recipe_id for recipe_id, _ in items], "titles": [title for _, title in items]}
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(key, str(category_id), orjson.dumps(payload))
+        pipe.expire(key, self.ttl.USER_BOOK_RECIPES)
+        await pipe.execute()
+
+    async def get_search_page(self, user_id: int, field: str) -> dict[str, object] | None:
+        """Вернёт закэшированную страницу поиска пользователя или None, если кэша нет."""
+        raw = await self.redis.hget(self.keys.user_search_pages(user_id), field)
+        if raw is None:
+            return None
+        try:
+            data = orjson.loads(raw)
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+        return None
+
+    async def set_search_page(self, user_id: int, field: str, page: dict[str, object]) -> None:
+        """Сохраняет страницу поиска в HASH пользователя; TTL общий на все страницы."""
+        key = self.keys.user_search_pages(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(key, field, orjson.dumps(page))
+        pipe.expire(key, self.ttl.USER_SEARCH_PAGES)
+        await pipe.execute()
+
+    async def invalidate_search_pages(self, user_id: int) -> None:
+        """Удаляет все закэшированные страницы поиска пользователя."""
+        await self.redis.delete(self.keys.user_search_pages(user_id))
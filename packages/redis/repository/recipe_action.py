@@ -2,6 +2,8 @@ import json
 
 from packages.redis.repository.base import BaseRedisRepository
 
+RECIPE_ACTIONS = ("recipes_state", "edit", "delete", "change_category")
+
 
 class RecipeActionCacheRepository(BaseRedisRepository):
 
@@ -26,6 +28,5 @@ class RecipeActionCacheRepository(BaseRedisRepository):
         await self.redis.delete(self.keys.user_recipe_action(user_id, action))
 
     async def delete_all(self, user_id: int) -> None:
-        """Удаляет все действия пользователя."""
-        for action in ("recipes_state", "edit", "delete", "change_category"):
-            await self.delete(user_id, action)
+        """Удаляет все действия пользователя одним DEL."""
+        await self.redis.delete(*(self.keys.user_recipe_action(user_id, action) for action in RECIPE_ACTIONS))
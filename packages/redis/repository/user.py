@@ -17,10 +17,26 @@ class UserCacheRepository(BaseRedisRepository):
         raw = await self.redis.get(self.keys.user_exists(user_id=user_id))
         return True if raw is not None else None
 
+    async def get_exists_and_recipe_count(self, user_id: int) -> tuple[bool | None, int | None]:
+        """Флаг существования и кэш количества рецептов одним MGET (горячий путь каждого апдейта)."""
+        exists_raw, count_raw = await self.redis.mget(
+            self.keys.user_exists(user_id=user_id),
+            self.keys.recipe_count(user_id=user_id),
+        )
+        return (True if exists_raw is not None else None), (int(count_raw) if count_raw is not None else None)
+
     async def set_exists(self, user_id: int) -> None:
         """Установить флаг 'пользователь существует'."""
         await self.redis.setex(self.keys.user_exists(user_id=user_id), self.ttl.USER_EXISTS, "1")
-        logger.debug(f"✅ Флаг существования пользователя {user_id} сохранён в кэше")
+        logger.debug("✅ Флаг существования пользователя %s сохранён в кэше", user_id)
+
+    async def set_exists_and_recipe_count(self, user_id: int, recipe_count: int) -> None:
+        """Флаг существования и количество рецептов одним pipeline (холодный старт пользователя)."""
+        count_ttl = self.ttl.RECIPE_COUNT_SHORT if recipe_count < 5 else self.ttl.RECIPE_COUNT_LONG
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.setex(self.keys.user_exists(user_id=user_id), self.ttl.USER_EXISTS, "1")
+        pipe.setex(self.keys.recipe_count(user_id=user_id), count_ttl, str(recipe_count))
+        await pipe.execute()
 
     async def invalidate_exists(self, user_id: int) -> None:
         """Удалить флаг 'пользователь существует'."""
@@ -5,6 +5,8 @@ LOCK = 10  # 10 секунд
 USER_CATEGORIES = 24 * 60 * 60  # 24 часа
 CATEGORY = 24 * 60 * 60  # 24 часа
 USER_RECIPES_IDS_AND_TITLES = 10 * 60  # 10 минут
+USER_SEARCH_PAGES = 5 * 60  # 5 минут
+USER_BOOK_RECIPES = 10 * 60  # 10 минут
 PIPELINE_DRAFT = 24 * 60 * 60  # 24 часа
 RECIPE_ACTION = 30 * 60  # 30 минут
 WEBAPP_RECIPE_DRAFT = 10 * 60  # 10 минут
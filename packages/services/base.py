@@ -1,5 +1,7 @@
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager, suppress
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import TypeVar
 
 from redis.asyncio import Redis
 
@@ -8,6 +10,13 @@ from packages.redis import ttl
 from packages.redis.keys import RedisKeys
 from packages.redis.lock_repository import RedisLockRepository
 
+T = TypeVar("T")
+
+# Сколько раз и с каким шагом проигравший гонку за lock перечитывает кэш,
+# прежде чем идти в БД самому.
+CACHE_WAIT_ATTEMPTS = 3
+CACHE_WAIT_STEP_SEC = 0.02
+
 
 class BaseService:
     def __init__(self, db: Database, redis: Redis) -> None:
@@ -16,11 +25,30 @@ class BaseService:
         self.keys = RedisKeys
 
     @asynccontextmanager
-    async def _lock(self, key: str) -> AsyncIterator[None]:
+    async def _lock(self, key: str) -> AsyncIterator[bool]:
+        """Best-effort распределённый lock; отдаёт True, если lock взят.
+
+        Кэш внутри стоит перечитать через `_reread_cache`: его мог заполнить
+        предыдущий держатель, пока мы ходили за SET NX.
+        """
         lock = await RedisLockRepository.acquire(self.redis, key=key, ttl_sec=ttl.LOCK)
         try:
-            yield
+            yield lock is not None
         finally:
             if lock:
-                with suppress(Exception):
-                    await RedisLockRepository.release(self.redis, lock)
+                await RedisLockRepository.release(self.redis, lock)
+
+    @staticmethod
+    async def _reread_cache(acquired: bool, read: Callable[[], Awaitable[T]]) -> T | None:
+        """Перечитать кэш внутри `_lock`.
+
+        Взявший lock читает один раз. Проигравший недолго опрашивает кэш: победитель
+        обычно успевает его заполнить, и в БД идти не нужно. Промах — только None.
+        """
+        if acquired:
+            return await read()
+        for _ in range(CACHE_WAIT_ATTEMPTS):
+            await asyncio.sleep(CACHE_WAIT_STEP_SEC)
+            if (value := await read()) is not None:
+                return value
+        return None
@@ -61,6 +61,12 @@ class BroadcastWorkerService(BaseService):
         async with self.db.session() as session:
             await self._repo(session).schedule_retry(message_id=message_id, error=error, next_retry_at=next_retry_at)
 
+    async def release_message(self, *, message_id: int, retry_after_sec: float) -> None:
+        """Отложить захваченное сообщение на retry_after без учёта попытки (до отправки не дошло)."""
+        next_retry_at = datetime.now(UTC) + timedelta(seconds=float(retry_after_sec))
+        async with self.db.session() as session:
+            await self._repo(session).release_message(message_id=message_id, next_retry_at=next_retry_at)
+
     async def complete_finished_campaigns(self) -> None:
         """Перевести в completed кампании, у которых не осталось необработанных сообщений."""
         async with self.db.session() as session:
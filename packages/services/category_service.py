@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 
 from packages.db.repository import CategoryRepository
 from packages.db.schemas import CategoryCreate, CategoryRead
@@ -7,6 +9,29 @@ from packages.services.base import BaseService
 
 logger = logging.getLogger(__name__)
 
+# Список всех категорий меняется только из админки — держим его в памяти процесса,
+# чтобы не ходить в Redis на каждом «Сохранить рецепт»/«Книга рецептов».
+ALL_CATEGORIES_LOCAL_TTL = 60.0  # секунд
+
+_all_categories_cache: tuple[float, list[CategoryRead]] = (0.0, [])
+_all_categories_refresh_lock = asyncio.Lock()
+
+# Загрузки категорий пользователя, которые сейчас идут в этом процессе.
+# Категории пользователя инвалидирует и backend (webapp), поэтому в памяти
+# их не держим — только склеиваем одновременные промахи в один запрос.
+_user_categories_inflight: dict[int, asyncio.Task[list[CategoryRead]]] = {}
+
+
+def invalidate_local_all_categories() -> None:
+    """Сбрасывает in-process кэш всех категорий (следующий вызов сходит в Redis/БД)."""
+    global _all_categories_cache
+    _all_categories_cache = (0.0, [])
+
+
+def _forget_user_categories_load(user_id: int, task: asyncio.Task[list[CategoryRead]]) -> None:
+    if _user_categories_inflight.get(user_id) is task:
+        del _user_categories_inflight[user_id]
+
 
 class CategoryService(BaseService):
     def __init__(self, *args, **kwargs):
@@ -15,13 +40,28 @@ class CategoryService(BaseService):
         self.category_repo = CategoryRepository
 
     async def get_user_categories(self, user_id: int) -> list[CategoryRead]:
-        """Категории пользователя с кешированием в Redis."""
+        """Категории пользователя с кешированием в Redis.
+
+        Одновременные вызовы для одного пользователя ждут общую загрузку.
+        """
+        task = _user_categories_inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(self._load_user_categories(user_id))
+            _user_categories_inflight[user_id] = task
+            task.add_done_callback(lambda done: _forget_user_categories_load(user_id, done))
+        return await asyncio.shield(task)
+
+    async def _load_user_categories(self, user_id: int) -> list[CategoryRead]:
         cached = await self.category_cache.get_user_categories(user_id)
-        logger.debug(f"👉 Пользователь {user_id}: категории из кэша: {cached}")
-        if cached:
+        logger.debug("👉 Пользователь %s: категории из кэша: %s", user_id, cached)
+        # Пустой список — тоже ответ (у пользователя ещё нет рецептов), а не промах.
+        if cached is not None:
             return [CategoryRead.model_validate(d) for d in cached]
 
-        async with self._lock(self.keys.user_init_lock(user_id=user_id)):
+        async with self._lock(self.keys.user_init_lock(user_id=user_id)) as acquired:
+            cached = await self._reread_cache(acquired, lambda: self.category_cache.get_user_categories(user_id))
+            if cached is not None:
+                return [CategoryRead.model_validate(d) for d in cached]
             async with self.db.session() as session:
                 categories = await self.category_repo(session).get_by_user_id(user_id)
             result = [CategoryRead.model_validate(c) for c in categories]
@@ -37,18 +77,47 @@ class CategoryService(BaseService):
         raise ValueError(f'Категория со slug="{slug}" не найдена')
 
     async def get_all_category(self) -> list[CategoryRead]:
+        """Все категории: in-process кэш с TTL поверх Redis-кэша.
+
+        При ошибке обновления (Redis/БД недоступны) отдаёт устаревший список, если он есть.
+        """
+        global _all_categories_cache
+        cached_at, cached = _all_categories_cache
+        if cached and time.monotonic() - cached_at < ALL_CATEGORIES_LOCAL_TTL:
+            return cached
+
+        async with _all_categories_refresh_lock:
+            # Пока ждали lock, список мог обновить другой запрос.
+            cached_at, cached = _all_categories_cache
+            if cached and time.monotonic() - cached_at < ALL_CATEGORIES_LOCAL_TTL:
+                return cached
+            try:
+                result = await self._load_all_categories()
+            except Exception:
+                if not cached:
+                    raise
+                logger.warning("Не удалось обновить список категорий, отдаём устаревший", exc_info=True)
+                return cached
+            if result:
+                _all_categories_cache = (time.monotonic(), result)
+        return result
+
+    async def _load_all_categories(self) -> list[CategoryRead]:
         """Все категории с кешированием в Redis."""
         cached = await self.category_cache.get_all_categories()
-        logger.debug(f"👉 Все категории из кэша: {cached}")
-        if cached:
+        logger.debug("👉 Все категории из кэша: %s", cached)
+        if cached is not None:
             return [CategoryRead.model_validate(d) for d in cached]
 
-        async with self._lock(self.keys.catergory_lock()):
+        async with self._lock(self.keys.catergory_lock()) as acquired:
+            cached = await self._reread_cache(acquired, self.category_cache.get_all_categories)
+            if cached is not None:
+                return [CategoryRead.model_validate(d) for d in cached]
             async with self.db.session() as session:
                 categories = await self.category_repo(session).get_all()
             result = [CategoryRead.model_validate(c) for c in categories]
             await self.category_cache.set_all_categories([r.model_dump() for r in result])
-            logger.debug(f"👉 Все категории из БД: {result}")
+            logger.debug("👉 Все категории из БД: %s", result)
         return result
 
     # ── Admin panel ───────────────────────────────────────────────────────────
@@ -70,6 +139,7 @@ class CategoryService(BaseService):
         async with self.db.session() as session:
             await self.category_repo(session).create(CategoryCreate(name=name, slug=slug))
         await self.category_cache.invalidate_all_categories()
+        invalidate_local_all_categories()
 
     async def update(self, cat_id: int, *, name: str, slug: str | None) -> None:
         """Обновить поля категории и инвалидировать кэш."""
@@ -77,6 +147,7 @@ class CategoryService(BaseService):
         async with self.db.session() as session:
             await self.category_repo(session).update_fields(cat_id, {"name": name, "slug": slug})
         await self.category_cache.invalidate_all_categories()
+        invalidate_local_all_categories()
 
     async def delete(self, cat_id: int) -> None:
         """Удалить категорию и инвалидировать кэш."""
@@ -84,3 +155,4 @@ class CategoryService(BaseService):
         async with self.db.session() as session:
             await self.category_repo(session).delete(cat_id)
         await self.category_cache.invalidate_all_categories()
+        invalidate_local_all_categories()
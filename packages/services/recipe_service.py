@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import logging
 import random
 from collections.abc import Iterable
@@ -38,6 +40,20 @@ class ExistingRecipeMatch:
     already_linked: bool = False  # уже сохранён у текущего пользователя
 
 
+def _search_cache_field(search_type: str, query: str, per_page: int, after_id: int, before_id: int) -> str:
+    """Поле HASH-кэша поиска: запрос хешируется, чтобы длина поля не зависела от ввода."""
+    digest = hashlib.blake2b(query.strip().lower().encode(), digest_size=8).hexdigest()
+    return f"{search_type}:{digest}:{per_page}:{after_id}:{before_id}"
+
+
+@dataclass(slots=True)
+class RecipeSearchPage:
+    """Страница поисковой выдачи (keyset-пагинация по id рецепта)."""
+
+    items: list[RecipeShort] = field(default_factory=list)
+    has_next: bool = False
+
+
 class RecipeService(BaseService):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -53,36 +69,49 @@ class RecipeService(BaseService):
     async def get_all_by_user_and_category(self, user_id: int, category_id: int) -> list[RecipeShort]:
         """Все id и названия рецептов пользователя."""
         cached = await self.recipe_cache.get_all_by_user_and_category(user_id, category_id)
-        logger.debug(f"👉 Пользователь: {user_id} категория: {category_id} " f"название рецептов и id: {cached}")
-        if cached:
+        logger.debug("👉 Пользователь: %s категория: %s название рецептов и id: %s", user_id, category_id, cached)
+        if cached is not None:
             return [RecipeShort.model_validate(r) for r in cached]
 
-        async with self._lock(self.keys.user_init_lock(user_id=user_id)):
+        async with self._lock(self.keys.user_init_lock(user_id=user_id)) as acquired:
+            cached = await self._reread_cache(
+                acquired, lambda: self.recipe_cache.get_all_by_user_and_category(user_id, category_id)
+            )
+            if cached is not None:
+                return [RecipeShort.model_validate(r) for r in cached]
             async with self.db.session() as session:
                 recipes = await self.recipe_repo(session).get_all_by_user_and_category(user_id, category_id)
             result = [RecipeShort.model_validate(r) for r in recipes]
             await self.recipe_cache.set_all_recipes_ids_and_titles(
                 user_id, category_id, [r.model_dump() for r in result]
             )
-        logger.debug(f"👉 Пользователь: {user_id} категория: {category_id} " f"название рецептов и id из БД: {result}")
+        logger.debug("👉 Пользователь: %s категория: %s название рецептов и id из БД: %s", user_id, category_id, result)
         return result
 
     async def get_book_recipes(self, category_id: int, *, exclude_user_id: int | None = None) -> list[RecipeShort]:
-        """Публичные рецепты категории (книга рецептов), кроме рецептов пользователя."""
+        """Публичные рецепты категории (книга рецептов), кроме рецептов пользователя.
+
+        Список для пользователя кэшируется в Redis: пагинация книги читает его
+        оттуда, а не из FSM-состояния.
+        """
+        if exclude_user_id is not None:
+            cached = await self.recipe_cache.get_book_recipes(exclude_user_id, category_id)
+            if cached is not None:
+                return [RecipeShort(id=recipe_id, title=title) for recipe_id, title in cached]
+
         async with self.db.session() as session:
             recipes = await self.recipe_repo(session).get_public_recipes_by_category(
                 category_id, exclude_user_id=exclude_user_id
             )
-        return [RecipeShort.model_validate(r) for r in recipes]
+        result = [RecipeShort.model_validate(r) for r in recipes]
+        if exclude_user_id is not None:
+            await self.recipe_cache.set_book_recipes(exclude_user_id, category_id, [(r.id, r.title) for r in result])
+        return result
 
     async def get_recipe_for_view(self, recipe_id: int) -> Recipe | None:
         """Рецепт со связями для показа карточки; попутно отмечает last_used_at."""
         async with self.db.session() as session:
-            repo = self.recipe_repo(session)
-            recipe = await repo.get_recipe_with_connections(recipe_id)
-            if recipe:
-                await repo.update_last_used_at(int(recipe.id))
-            return recipe
+            return await self.recipe_repo(session).touch_and_get_with_connections(recipe_id)
 
     async def get_recipe_with_details(self, recipe_id: int) -> Recipe | None:
         """Рецепт со связями без отметки last_used_at (для просмотра по шаринг-ссылке)."""
@@ -92,7 +121,7 @@ class RecipeService(BaseService):
     async def get_recipe_basic(self, recipe_id: int) -> Recipe | None:
         """Рецепт без связей (название/описание)."""
         async with self.db.session() as session:
-            return await self.recipe_repo(session).get_by_id(recipe_id)
+            return await self.recipe_repo(session).get_basic(recipe_id)
 
     async def find_existing_by_url(self, url: str, user_id: int | None, *, limit: int) -> ExistingRecipeMatch:
         """Ищет уже сохранённый рецепт по исходному URL видео.
@@ -139,13 +168,24 @@ class RecipeService(BaseService):
         return [by_id[rid] for rid in recipe_ids if rid in by_id]
 
     async def get_recipe_with_link_status(self, recipe_id: int, user_id: int) -> tuple[Recipe | None, bool]:
-        """Рецепт со связями + флаг, привязан ли он к пользователю."""
-        async with self.db.session() as session:
-            recipe = await self.recipe_repo(session).get_recipe_with_connections(recipe_id)
-            if not recipe:
-                return None, False
-            already_linked = await self.recipe_user_repo(session).is_linked(recipe_id, user_id)
-            return recipe, already_linked
+        """Рецепт со связями + флаг, привязан ли он к пользователю.
+
+        Запросы независимы, поэтому идут параллельно — каждый в своей сессии
+        (одну AsyncSession нельзя использовать конкурентно).
+        """
+
+        async def load_recipe() -> Recipe | None:
+            async with self.db.session() as session:
+                return await self.recipe_repo(session).get_recipe_with_connections(recipe_id)
+
+        async def load_link_status() -> bool:
+            async with self.db.session() as session:
+                return await self.recipe_user_repo(session).is_linked(recipe_id, user_id)
+
+        recipe, already_linked = await asyncio.gather(load_recipe(), load_link_status())
+        if not recipe:
+            return None, False
+        return recipe, already_linked
 
     async def link_recipe_to_user(self, recipe_id: int, user_id: int, category_id: int) -> bool:
         """Привязывает рецепт к пользователю/категории и инвалидирует кэш.
@@ -155,21 +195,57 @@ class RecipeService(BaseService):
         async with self.db.session() as session:
             created = await self.recipe_user_repo(session).upsert_user_link(recipe_id, user_id, category_id)
         await self.category_cache.invalidate_user_categories(user_id)
-        await self.recipe_cache.invalidate_recipe_count(user_id)
-        await self.recipe_cache.invalidate_all_recipes_ids_and_titles(user_id, category_id)
+        await self.recipe_cache.invalidate_user_recipes(user_id, category_id)
         return created
 
-    async def search_by_title(self, user_id: int, query: str) -> list[RecipeShort]:
-        """Поиск рецептов пользователя по названию."""
-        async with self.db.session() as session:
-            recipes = await self.recipe_repo(session).search_recipes_by_title(user_id, query)
-        return [RecipeShort.model_validate(r) for r in recipes]
+    async def search_page(
+        self,
+        user_id: int,
+        search_type: str,
+        query: str,
+        *,
+        per_page: int,
+        after_id: int = 0,
+        before_id: int = 0,
+    ) -> RecipeSearchPage:
+        """Страница поиска рецептов пользователя по названию или ингредиенту.
+
+        Без before_id — рецепты с id > after_id (вперёд), с before_id — предыдущая
+        страница перед ним. Из БД читается не больше per_page + 1 строк.
+        """
+        cache_field = _search_cache_field(search_type, query, per_page, after_id, before_id)
+        try:
+            cached = await self.recipe_cache.get_search_page(user_id, cache_field)
+        except Exception as e:
+            logger.warning("Не удалось прочитать кэш поиска user_id=%s: %s", user_id, e)
+            cached = None
+        if cached is not None:
+            return RecipeSearchPage(
+                items=[RecipeShort(id=recipe_id, title=title) for recipe_id, title in cached.get("items", [])],
+                has_next=bool(cached.get("has_next")),
+            )
 
-    async def search_by_ingredient(self, user_id: int, query: str) -> list[RecipeShort]:
-        """Поиск рецептов пользователя по ингредиенту."""
         async with self.db.session() as session:
-            recipes = await self.recipe_repo(session).search_recipes_by_ingredient(user_id, query)
-        return [RecipeShort.model_validate(r) for r in recipes]
+            repo = self.recipe_repo(session)
+            search = repo.search_page_by_title if search_type == "title" else repo.search_page_by_ingredient
+            rows = await search(
+                user_id,
+                query,
+                limit=per_page if before_id else per_page + 1,
+                after_id=after_id,
+                before_id=before_id,
+            )
+        items = [RecipeShort(id=recipe_id, title=title) for recipe_id, title in rows[:per_page]]
+        result = RecipeSearchPage(items=items, has_next=bool(before_id) or len(rows) > per_page)
+        try:
+            await self.recipe_cache.set_search_page(
+                user_id,
+                cache_field,
+                {"items": [[item.id, item.title] for item in items], "has_next": result.has_next},
+            )
+        except Exception as e:
+            logger.warning("Не удалось сохранить кэш поиска user_id=%s: %s", user_id, e)
+        return result
 
     async def get_recipe_name(self, recipe_id: int) -> str | None:
         """Название рецепта по id."""
@@ -180,17 +256,27 @@ class RecipeService(BaseService):
         """Удаляет связь рецепт-пользователь и инвалидирует кэш."""
         async with self.db.session() as session:
             category_id = await self.recipe_repo(session).get_category_id_by_recipe_id(recipe_id, user_id)
-            logger.debug(f"👉 Рецепт {recipe_id} category_id: {category_id}")
+            logger.debug("👉 Рецепт %s category_id: %s", recipe_id, category_id)
             await self.recipe_user_repo(session).unlink_user(recipe_id, user_id)
         if category_id is not None:
-            await self.recipe_cache.invalidate_all_recipes_ids_and_titles(user_id, category_id)
+            await self.recipe_cache.invalidate_user_recipes(user_id, category_id)
+        else:
+            await self.recipe_cache.invalidate_search_pages(user_id)
 
     async def get_random_recipe(self, user_id: int, category_id: int) -> Recipe | None:
-        """Возвращает случайный рецепт пользователя из категории."""
-        recipes = await self.get_all_by_user_and_category(user_id, category_id)
-        if not recipes:
+        """Возвращает случайный рецепт пользователя из категории.
+
+        id берётся из закэшированного списка категории, а при промахе выбирается
+        в БД одной строкой — весь список ради одного id не грузится.
+        """
+        cached = await self.recipe_cache.get_all_by_user_and_category(user_id, category_id)
+        if cached is not None:
+            recipe_id = int(random.choice(cached)["id"]) if cached else None
+        else:
+            async with self.db.session() as session:
+                recipe_id = await self.recipe_repo(session).get_random_id_by_category(user_id, category_id)
+        if recipe_id is None:
             return None
-        recipe_id = random.choice(recipes).id
         return await self.get_recipe_for_view(recipe_id)
 
     async def save_recipe_draft(
@@ -252,10 +338,12 @@ class RecipeService(BaseService):
         async with self.db.session() as session:
             repo = self.recipe_repo(session)
             category_id = await repo.get_category_id_by_recipe_id(recipe_id, user_id)
-            logger.debug(f"👉 Рецепт {recipe_id} category_id: {category_id}")
+            logger.debug("👉 Рецепт %s category_id: %s", recipe_id, category_id)
             await repo.update_title(recipe_id, new_title)
         if category_id is not None:
-            await self.recipe_cache.invalidate_all_recipes_ids_and_titles(user_id, category_id)
+            await self.recipe_cache.invalidate_recipe_titles(user_id, category_id)
+        else:
+            await self.recipe_cache.invalidate_search_pages(user_id)
 
     # ── Admin panel ───────────────────────────────────────────────────────────
 
@@ -25,13 +25,50 @@ class UserService(BaseService):
         if exists is not None:
             return
 
-        async with self._lock(self.keys.user_init_lock(user_id=user_id)):
+        async with self.db.session() as session:
+            user = await self.user_repo(session).get_by_id(user_id)
+        logger.debug("👉 Пользователь %s из БД: %s", user_id, user)
+        if user is None and not await self._create_user_locked(user_data):
+            return
+        await self.user_cache.set_exists(user_id)
+
+    async def ensure_user_and_get_recipe_count(self, user_data: UserCreate) -> int:
+        """ensure_user_exists() + get_recipe_count(): оба кэша читаются за один round-trip в Redis."""
+        user_id = user_data.id
+        exists, recipe_count = await self.user_cache.get_exists_and_recipe_count(user_id)
+        if exists is None and recipe_count is None:
+            return await self._bootstrap_user(user_data)
+        if exists is None:
+            await self.ensure_user_exists(user_data)
+        if recipe_count is None:
+            recipe_count = await self.get_recipe_count(user_id)
+        return recipe_count
+
+    async def _bootstrap_user(self, user_data: UserCreate) -> int:
+        """Холодный старт: пользователь и счётчик рецептов за одну сессию БД и одну запись в Redis."""
+        user_id = user_data.id
+        async with self.db.session() as session:
+            user = await self.user_repo(session).get_by_id(user_id)
+            recipe_count = 0 if user is None else await RecipeRepository(session).get_count_by_user(user_id)
+        if user is None and not await self._create_user_locked(user_data):
+            return await self.get_recipe_count(user_id)
+        await self.user_cache.set_exists_and_recipe_count(user_id, recipe_count)
+        return recipe_count
+
+    async def _create_user_locked(self, user_data: UserCreate) -> bool:
+        """Создаёт пользователя под init-lock (double-checked: после чтения БД без lock'а).
+
+        Возвращает False, если за время ожидания lock'а флаг в кэше выставил другой воркер.
+        """
+        user_id = user_data.id
+        async with self._lock(self.keys.user_init_lock(user_id=user_id)) as acquired:
+            exists = await self._reread_cache(acquired, lambda: self.user_cache.get_exists(user_id))
+            if exists is not None:
+                return False
             async with self.db.session() as session:
-                user = await self.user_repo(session).get_by_id(user_id)
-                logger.debug("👉 Пользователь %s из БД: %s", user_id, user)
-                if user is None:
-                    user = await self.user_repo(session).create(user_data)
-            await self.user_cache.set_exists(user.id)
+                if await self.user_repo(session).get_by_id(user_id) is None:
+                    await self.user_repo(session).create(user_data)
+        return True
 
     async def get_recipe_count(self, user_id: int) -> int:
         """Возвращает количество рецептов пользователя с кэшированием в Redis."""
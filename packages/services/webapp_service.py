@@ -1,8 +1,6 @@
-import asyncio
 from dataclasses import dataclass
 from html import escape as html_escape
 
-import requests
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from packages.common_settings.settings import settings
@@ -15,6 +13,7 @@ from packages.db.repository import (
     VideoRepository,
 )
 from packages.db.schemas import RecipeUpdate
+from packages.integrations.telegram_api import tg_call
 from packages.recipes_core.ingredients_parser import parse_ingredients_lines
 from packages.redis.repository import (
     CategoryCacheRepository,
@@ -39,6 +38,7 @@ class PatchResult:
     title_changed: bool
     category_changed: bool
     membership_changed: bool
+    ingredients_changed: bool
     old_category_id: int
     new_category_id: int
 
@@ -131,6 +131,7 @@ class WebAppService(BaseService):
             title_changed=result.title_changed,
             category_changed=result.category_changed,
             membership_changed=result.membership_changed,
+            ingredients_changed=result.ingredients_changed,
             draft_recipe_id_to_clear=path_recipe_id,
         )
         await self._update_telegram_message(user_id=user_id, recipe=recipe)
@@ -208,6 +209,7 @@ class WebAppService(BaseService):
             title_changed=title_changed,
             category_changed=category_changed,
             membership_changed=membership_changed,
+            ingredients_changed=ingredients_will_change,
             old_category_id=old_category_id,
             new_category_id=int(new_category_id),
         )
@@ -258,13 +260,17 @@ class WebAppService(BaseService):
         title_changed: bool,
         category_changed: bool,
         membership_changed: bool,
+        ingredients_changed: bool,
         draft_recipe_id_to_clear: int,
     ) -> None:
         try:
+            recipe_cache = RecipeCacheRepository(self.redis)
             if title_changed or category_changed or membership_changed:
-                recipe_cache = RecipeCacheRepository(self.redis)
                 for cid in {int(old_category_id), int(new_category_id)}:
-                    await recipe_cache.invalidate_all_recipes_ids_and_titles(int(user_id), cid)
+                    await recipe_cache.invalidate_recipe_titles(int(user_id), cid)
+            elif ingredients_changed:
+                # Страницы поиска по ингредиентам (invalidate_recipe_titles их тоже удаляет).
+                await recipe_cache.invalidate_search_pages(int(user_id))
             if category_changed or membership_changed:
                 await self.category_cache.invalidate_user_categories(int(user_id))
             await WebAppRecipeDraftCacheRepository(self.redis).clear(
@@ -295,7 +301,8 @@ class WebAppService(BaseService):
             "inline_keyboard": [
                 [{"text": "✏️ Редактировать рецепт", "web_app": {"url": webapp_url}}],
                 [{"text": "🗑 Удалить рецепт", "callback_data": f"recipe:delete:{int(recipe.id)}"}],
-                [{"text": "⏪ Назад", "callback_data": f"page:{page}:{category_slug}:{mode}"}],
+                # Формат PageCB бота: page:category:mode:after:before (курсор поиска пуст).
+                [{"text": "⏪ Назад", "callback_data": f"page:{page}:{category_slug}:{mode}:0:0"}],
                 [{"text": "🏠 На главную", "callback_data": "nav:start"}],
             ]
         }
@@ -320,7 +327,6 @@ class WebAppService(BaseService):
         token = settings.telegram.bot_token.get_secret_value().strip()
         if not token:
             return
-        url = f"https://api.telegram.org/bot{token}/editMessageText"
         payload = {
             "chat_id": cached.chat_id,
             "message_id": target_message_id,
@@ -330,10 +336,7 @@ class WebAppService(BaseService):
             "reply_markup": reply_markup,
         }
 
-        def _call() -> None:
-            try:
-                requests.post(url, json=payload, timeout=7).raise_for_status()
-            except Exception:
-                pass
-
-        await asyncio.to_thread(_call)
+        try:
+            await tg_call("editMessageText", payload, bot_token=token, timeout=7)
+        except Exception:
+            pass
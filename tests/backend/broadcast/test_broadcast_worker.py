@@ -0,0 +1,66 @@
+"""Тесты цикла воркера рассылки: flood control посреди пачки."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.tasks import broadcast as broadcast_module
+
+FLOOD_RESPONSE = {
+    "ok": False,
+    "error_code": 429,
+    "description": "Too Many Requests: retry after 42",
+    "parameters": {"retry_after": 42},
+}
+
+
+async def test_flood_mid_batch_releases_rest_without_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = AsyncMock()
+    service.list_active_campaign_ids.return_value = [7]
+    # (message_id, chat_id, attempt): третье сообщение уже на последней попытке.
+    service.claim_messages.return_value = [(1, 101, 1), (2, 102, 3), (3, 103, 8)]
+    service.send_to_chat.side_effect = [{"ok": True}, FLOOD_RESPONSE]
+
+    lock_repo = SimpleNamespace(
+        acquire=AsyncMock(return_value=object()),
+        refresh=AsyncMock(return_value=True),
+        release=AsyncMock(),
+    )
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        if delay >= 1:
+            # Первая же пауза на flood control — дальше цикл не интересен.
+            raise asyncio.CancelledError
+
+    broadcast_settings = SimpleNamespace(
+        enabled=True,
+        lock_ttl_sec=60,
+        max_messages_per_second=1000,
+        batch_size=50,
+        max_attempts=8,
+        tick_seconds=5,
+    )
+    monkeypatch.setattr(broadcast_module, "settings", SimpleNamespace(broadcast=broadcast_settings))
+    monkeypatch.setattr(broadcast_module, "BroadcastWorkerService", MagicMock(return_value=service))
+    monkeypatch.setattr(broadcast_module, "RedisLockRepository", lock_repo)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await broadcast_module.run_broadcast_worker(MagicMock())
+
+    service.mark_message_sent.assert_awaited_once_with(campaign_id=7, message_id=1)
+    service.schedule_retry.assert_awaited_once_with(
+        message_id=2,
+        error=FLOOD_RESPONSE["description"],
+        retry_after_sec=42.0,
+        attempt=3,
+    )
+    service.release_message.assert_awaited_once_with(message_id=3, retry_after_sec=42.0)
+    service.mark_message_failed.assert_not_awaited()
+    service.complete_finished_campaigns.assert_not_awaited()
+    assert sleeps[-1] == broadcast_settings.lock_ttl_sec / 3
+    lock_repo.release.assert_awaited_once()
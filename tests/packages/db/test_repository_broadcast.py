@@ -1,12 +1,13 @@
 """Тесты для BroadcastRepository."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from packages.db.models import BroadcastMessage
 from packages.db.repository import BroadcastRepository
-from packages.enums import BroadcastCampaignStatus
+from packages.enums import BroadcastCampaignStatus, BroadcastMessageStatus
 
 
 class TestBroadcastRepositoryCampaigns:
@@ -262,3 +263,36 @@ class TestBroadcastRepositoryMessages:
 
         # Может быть пусто или с сообщениями
         assert isinstance(messages, list)
+
+    async def test_release_message_returns_attempt(self, db_session: AsyncSession) -> None:
+        """Сообщение, снятое с пачки из-за 429, возвращается в retry без списания попытки."""
+        repo = BroadcastRepository(db_session)
+        campaign = await repo.create_campaign(
+            name="Кампания с flood control",
+            status=BroadcastCampaignStatus.running,
+            audience_type="all_users",
+            audience_params_json=None,
+            text="Текст",
+            parse_mode="HTML",
+            disable_web_page_preview=False,
+            reply_markup_json=None,
+            photo_file_id=None,
+            photo_url=None,
+            scheduled_at=None,
+        )
+        message = BroadcastMessage(campaign_id=campaign.id, chat_id=100500)
+        db_session.add(message)
+        await db_session.flush()
+
+        claimed = await repo.claim_messages_for_campaign(campaign_id=campaign.id, batch_size=10)
+        assert claimed == [(message.id, 100500, 1)]
+
+        next_retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        await repo.release_message(message_id=message.id, next_retry_at=next_retry_at)
+        await db_session.refresh(message)
+
+        assert message.status == BroadcastMessageStatus.retry
+        assert message.attempts == 0
+        assert message.locked_until is None
+        assert message.next_retry_at == next_retry_at
+        assert await repo.claim_messages_for_campaign(campaign_id=campaign.id, batch_size=10) == []
@@ -1,6 +1,7 @@
 """Тесты для RecipeRepository."""
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from packages.db.repository import (
@@ -174,6 +175,106 @@ class TestRecipeRepositoryGet:
 
         assert count == 0
 
+    async def test_get_random_id_by_category(self, db_session: AsyncSession) -> None:
+        """Случайный id выбирается только среди рецептов пользователя в категории."""
+        user = await UserRepository(db_session).create(UserCreate(id=567890, username="user5"))
+        category = await CategoryRepository(db_session).create(CategoryCreate(name="Ужины", slug="dinners"))
+        other = await CategoryRepository(db_session).create(CategoryCreate(name="Десерты", slug="desserts"))
+
+        repo = RecipeRepository(db_session)
+        ids = {
+            (await repo.create(RecipeCreate(title=f"Ужин {i}", user_id=user.id, category_id=category.id))).id
+            for i in range(3)
+        }
+        await repo.create(RecipeCreate(title="Торт", user_id=user.id, category_id=other.id))
+
+        assert await repo.get_random_id_by_category(user.id, category.id) in ids
+        assert await repo.get_random_id_by_category(456, category.id) is None
+
+
+class TestRecipeRepositoryLoading:
+    """Тесты стратегий загрузки связей RecipeRepository."""
+
+    async def test_get_recipe_with_connections_loads_only_card_relations(self, db_session: AsyncSession) -> None:
+        """Ингредиенты и видео загружены, прочие связи не подгружаются неявно."""
+        repo = RecipeRepository(db_session)
+        recipe = await repo.create_basic(title="Окрошка", description="На квасе")
+        recipe_id = recipe.id
+        db_session.expunge_all()
+
+        loaded = await repo.get_recipe_with_connections(recipe_id)
+
+        assert loaded is not None
+        assert loaded.ingredient_links == []
+        assert loaded.video is None
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.linked_users
+
+    async def test_touch_and_get_with_connections(self, db_session: AsyncSession) -> None:
+        """Карточка грузится тем же запросом, что отмечает last_used_at."""
+        repo = RecipeRepository(db_session)
+        recipe = await repo.create_basic(title="Борщ", description="Со сметаной")
+        recipe_id = recipe.id
+        db_session.expunge_all()
+
+        loaded = await repo.touch_and_get_with_connections(recipe_id)
+
+        assert loaded is not None
+        assert loaded.ingredient_links == []
+        assert loaded.video is None
+        await db_session.refresh(loaded, ["last_used_at"])
+        assert loaded.last_used_at is not None
+        assert await repo.touch_and_get_with_connections(recipe_id + 1000) is None
+
+    async def test_get_basic_skips_relations(self, db_session: AsyncSession) -> None:
+        """get_basic() возвращает рецепт без загрузки связей."""
+        repo = RecipeRepository(db_session)
+        recipe = await repo.create_basic(title="Сырники", description="Из творога")
+        recipe_id = recipe.id
+        db_session.expunge_all()
+
+        loaded = await repo.get_basic(recipe_id)
+
+        assert loaded is not None
+        assert loaded.title == "Сырники"
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.ingredient_links
+
+
+class TestRecipeRepositorySearchPage:
+    """Тесты keyset-пагинации поиска RecipeRepository.search_page_by_*()."""
+
+    async def _create_user_recipes(self, db_session: AsyncSession, titles: list[str]) -> list[int]:
+        user = await UserRepository(db_session).create(UserCreate(id=424242, username="searcher"))
+        category = await CategoryRepository(db_session).create(CategoryCreate(name="Супы", slug="soups"))
+        repo = RecipeRepository(db_session)
+        ids = []
+        for title in titles:
+            recipe = await repo.create(
+                RecipeCreate(title=title, description="", user_id=user.id, category_id=category.id)
+            )
+            ids.append(recipe.id)
+        return ids
+
+    async def test_search_page_forward_and_back(self, db_session: AsyncSession) -> None:
+        """Страницы по after_id/before_id идут по возрастанию id без пропусков."""
+        ids = await self._create_user_recipes(db_session, ["Суп 1", "Суп 2", "Суп 3", "Борщ"])
+        repo = RecipeRepository(db_session)
+
+        first = await repo.search_page_by_title(424242, "суп", limit=2)
+        second = await repo.search_page_by_title(424242, "суп", limit=2, after_id=first[-1][0])
+        back = await repo.search_page_by_title(424242, "суп", limit=2, before_id=second[0][0])
+
+        assert [rid for rid, _ in first] == ids[:2]
+        assert [rid for rid, _ in second] == [ids[2]]
+        assert back == first
+
+    async def test_search_page_other_user_is_empty(self, db_session: AsyncSession) -> None:
+        """Поиск не видит рецепты других пользователей."""
+        await self._create_user_recipes(db_session, ["Суп"])
+
+        assert await RecipeRepository(db_session).search_page_by_title(1, "суп", limit=5) == []
+
 
 class TestRecipeRepositoryDelete:
     """Тесты для RecipeRepository.delete()."""
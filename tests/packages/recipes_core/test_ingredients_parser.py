@@ -0,0 +1,39 @@
+"""Тесты легаси-парсера ингредиентов и to_ingredient_name."""
+
+from packages.recipes_core.ingredients_parser import (
+    parse_ingredients,
+    to_ingredient_name,
+)
+
+
+class TestParseIngredients:
+
+    def test_bulleted_lines(self):
+        """Берутся только строки с маркером «- », пробелы по краям срезаются."""
+        text = "Ингредиенты:\n- Мука  \n  - Молоко\nСоль\n-Сахар\n"
+        assert parse_ingredients(text) == ["Мука", "Молоко"]
+
+    def test_crlf_line_endings(self):
+        assert parse_ingredients("- Яйца\r\n- Масло\r\n") == ["Яйца", "Масло"]
+
+    def test_empty_marker_skipped(self):
+        """Строка из одного маркера не даёт пустой ингредиент."""
+        assert parse_ingredients("- \n-   \n- Лук") == ["Лук"]
+
+    def test_empty_text(self):
+        assert parse_ingredients("") == []
+
+
+class TestToIngredientName:
+
+    def test_string(self):
+        assert to_ingredient_name("  Мука ") == "Мука"
+
+    def test_dict(self):
+        assert to_ingredient_name({"name": " Соль "}) == "Соль"
+
+    def test_dict_without_name(self):
+        assert to_ingredient_name({"name": None}) == ""
+
+    def test_none(self):
+        assert to_ingredient_name(None) == ""
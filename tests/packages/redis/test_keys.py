@@ -33,6 +33,8 @@ class TestRedisKeysFormat:
             RedisKeys.all_category(),
             RedisKeys.catergory_lock(),
             RedisKeys.user_recipes_ids_and_titles(1, 2),
+            RedisKeys.user_search_pages(1),
+            RedisKeys.user_book_recipes(1),
             RedisKeys.user_last_recipe_messages(1),
             RedisKeys.user_pipeline_draft(1, 2),
             RedisKeys.user_pipeline_ids(1),
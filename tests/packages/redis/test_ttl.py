@@ -13,6 +13,8 @@ class TestTTLValues:
             ttl.LOCK,
             ttl.USER_CATEGORIES,
             ttl.USER_RECIPES_IDS_AND_TITLES,
+            ttl.USER_SEARCH_PAGES,
+            ttl.USER_BOOK_RECIPES,
             ttl.PIPELINE_DRAFT,
             ttl.RECIPE_ACTION,
             ttl.WEBAPP_RECIPE_DRAFT,
@@ -0,0 +1,113 @@
+"""Тесты in-process кэша и single-flight загрузок CategoryService."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from packages.services import category_service as category_service_module
+from packages.services.category_service import (
+    CategoryService,
+    invalidate_local_all_categories,
+)
+
+_CATEGORIES = [{"id": 1, "name": "Завтраки", "slug": "breakfast"}]
+
+
+def make_service(cached: list[dict] | None = _CATEGORIES, db: MagicMock | None = None) -> CategoryService:
+    """CategoryService с замоканным Redis-кэшем категорий."""
+    service = CategoryService(db=db or MagicMock(), redis=MagicMock())
+    service.category_cache = MagicMock()
+    service.category_cache.get_all_categories = AsyncMock(return_value=cached)
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _reset_local_cache():
+    invalidate_local_all_categories()
+    yield
+    invalidate_local_all_categories()
+
+
+class TestGetAllCategoryLocalCache:
+
+    async def test_second_call_skips_redis(self) -> None:
+        """Повторный вызов в пределах TTL не ходит в Redis."""
+        service = make_service()
+
+        first = await service.get_all_category()
+        second = await make_service().get_all_category()
+
+        assert [c.slug for c in first] == ["breakfast"]
+        assert second == first
+        service.category_cache.get_all_categories.assert_awaited_once()
+
+    async def test_expired_cache_is_refreshed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """После истечения TTL список перечитывается из Redis."""
+        service = make_service()
+        await service.get_all_category()
+
+        monkeypatch.setattr(category_service_module, "ALL_CATEGORIES_LOCAL_TTL", 0.0)
+        await service.get_all_category()
+
+        assert service.category_cache.get_all_categories.await_count == 2
+
+    async def test_stale_served_on_refresh_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Если Redis недоступен, отдаётся устаревший список."""
+        service = make_service()
+        first = await service.get_all_category()
+
+        monkeypatch.setattr(category_service_module, "ALL_CATEGORIES_LOCAL_TTL", 0.0)
+        service.category_cache.get_all_categories.side_effect = ConnectionError("redis down")
+
+        assert await service.get_all_category() == first
+
+    async def test_refresh_error_without_cache_propagates(self) -> None:
+        """Без устаревшего списка ошибка обновления пробрасывается."""
+        service = make_service()
+        service.category_cache.get_all_categories.side_effect = ConnectionError("redis down")
+
+        with pytest.raises(ConnectionError):
+            await service.get_all_category()
+
+    async def test_cached_empty_list_is_a_hit(self) -> None:
+        """Пустой список в Redis — попадание: ни lock, ни БД не трогаются."""
+        db = MagicMock()
+        service = make_service(cached=[], db=db)
+
+        assert await service.get_all_category() == []
+        service.category_cache.get_all_categories.assert_awaited_once()
+        db.session.assert_not_called()
+
+
+class TestGetUserCategoriesSingleFlight:
+
+    async def test_concurrent_calls_share_one_load(self) -> None:
+        """Одновременные запросы одного пользователя читают Redis один раз."""
+        service = make_service()
+        service.category_cache.get_user_categories = AsyncMock(return_value=_CATEGORIES)
+
+        first, second = await asyncio.gather(service.get_user_categories(7), service.get_user_categories(7))
+
+        assert [c.slug for c in first] == ["breakfast"]
+        assert second == first
+        service.category_cache.get_user_categories.assert_awaited_once_with(7)
+
+    async def test_sequential_calls_are_not_cached(self) -> None:
+        """После завершения загрузки следующий вызов снова идёт в Redis."""
+        service = make_service()
+        service.category_cache.get_user_categories = AsyncMock(return_value=_CATEGORIES)
+
+        await service.get_user_categories(7)
+        await service.get_user_categories(7)
+
+        assert service.category_cache.get_user_categories.await_count == 2
+
+    async def test_cached_empty_list_is_a_hit(self) -> None:
+        """Закэшированный пустой список не считается промахом и не ведёт в БД."""
+        db = MagicMock()
+        service = make_service(db=db)
+        service.category_cache.get_user_categories = AsyncMock(return_value=[])
+
+        assert await service.get_user_categories(7) == []
+        db.session.assert_not_called()
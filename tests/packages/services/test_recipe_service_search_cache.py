@@ -0,0 +1,71 @@
+"""Тесты Redis-кэша страниц поиска RecipeService.search_page()."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from packages.services.recipe_service import RecipeService
+
+
+def make_service(rows: list[tuple[int, str]], cached: dict | None = None) -> tuple[RecipeService, AsyncMock]:
+    """RecipeService с замоканными БД-поиском и кэшем страниц."""
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def _session_ctx():
+        yield MagicMock()
+
+    db.session.side_effect = _session_ctx
+    service = RecipeService(db=db, redis=MagicMock())
+    search = AsyncMock(return_value=rows)
+    repo = MagicMock(search_page_by_title=search, search_page_by_ingredient=search)
+    service.recipe_repo = MagicMock(return_value=repo)
+    service.recipe_cache = MagicMock()
+    service.recipe_cache.get_search_page = AsyncMock(return_value=cached)
+    service.recipe_cache.set_search_page = AsyncMock()
+    return service, search
+
+
+class TestSearchPageCache:
+
+    async def test_cache_hit_skips_db(self) -> None:
+        """Закэшированная страница отдаётся без запроса в БД."""
+        cached = {"items": [[7, "Борщ"]], "has_next": True}
+        service, search = make_service([], cached=cached)
+
+        page = await service.search_page(1, "title", "борщ", per_page=5)
+
+        assert [(r.id, r.title) for r in page.items] == [(7, "Борщ")]
+        assert page.has_next is True
+        search.assert_not_awaited()
+
+    async def test_cache_miss_stores_page(self) -> None:
+        """При промахе страница читается из БД и сохраняется в кэш без лишней строки."""
+        service, search = make_service([(1, "Суп"), (2, "Суп-пюре"), (3, "Суп харчо")])
+
+        page = await service.search_page(1, "title", "суп", per_page=2)
+
+        assert [r.id for r in page.items] == [1, 2]
+        search.assert_awaited_once()
+        stored = service.recipe_cache.set_search_page.await_args.args[2]
+        assert stored == {"items": [[1, "Суп"], [2, "Суп-пюре"]], "has_next": True}
+
+    async def test_cache_field_ignores_query_case(self) -> None:
+        """Запросы, отличающиеся регистром, попадают в одно поле кэша."""
+        service, _ = make_service([])
+
+        await service.search_page(1, "title", "Суп", per_page=5)
+        await service.search_page(1, "title", "суп ", per_page=5)
+
+        fields = [call.args[1] for call in service.recipe_cache.get_search_page.await_args_list]
+        assert fields[0] == fields[1]
+
+    async def test_cache_error_falls_back_to_db(self) -> None:
+        """Ошибка Redis не ломает поиск."""
+        service, search = make_service([(1, "Суп")])
+        service.recipe_cache.get_search_page.side_effect = ConnectionError("redis down")
+        service.recipe_cache.set_search_page.side_effect = ConnectionError("redis down")
+
+        page = await service.search_page(1, "ingredient", "лук", per_page=5)
+
+        assert [r.id for r in page.items] == [1]
+        search.assert_awaited_once()
@@ -0,0 +1,116 @@
+"""Тесты UserService.ensure_user_and_get_recipe_count()."""
+
+from contextlib import asynccontextmanager
+from typing import NamedTuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from packages.db.schemas import UserCreate
+from packages.services import user_service as user_service_module
+from packages.services.user_service import UserService
+
+_USER = UserCreate(id=1, username="cook", first_name="Анна", last_name=None)
+
+
+class SlowPaths(NamedTuple):
+    """Моки медленных путей UserService."""
+
+    ensure_user_exists: AsyncMock
+    get_recipe_count: AsyncMock
+
+
+def make_service(
+    monkeypatch: pytest.MonkeyPatch, exists: bool | None, recipe_count: int | None, db: MagicMock | None = None
+) -> tuple[UserService, SlowPaths]:
+    """UserService с замоканным MGET и медленными путями."""
+    service = UserService(db=db or MagicMock(), redis=MagicMock())
+    service.user_cache = MagicMock()
+    service.user_cache.get_exists_and_recipe_count = AsyncMock(return_value=(exists, recipe_count))
+    slow = SlowPaths(ensure_user_exists=AsyncMock(), get_recipe_count=AsyncMock(return_value=3))
+    monkeypatch.setattr(service, "ensure_user_exists", slow.ensure_user_exists)
+    monkeypatch.setattr(service, "get_recipe_count", slow.get_recipe_count)
+    return service, slow
+
+
+def make_cold_service(
+    user: object | None, monkeypatch: pytest.MonkeyPatch
+) -> tuple[UserService, SlowPaths, list[str], MagicMock]:
+    """UserService без кэша: lock всегда берётся, БД и pipeline-запись замоканы.
+
+    Кроме сервиса возвращает ключи взятых lock'ов и мок класса RecipeRepository.
+    """
+    lock_keys: list[str] = []
+
+    @asynccontextmanager
+    async def fake_lock(key: str):
+        lock_keys.append(key)
+        yield True
+
+    @asynccontextmanager
+    async def fake_session():
+        yield MagicMock()
+
+    db = MagicMock()
+    db.session = fake_session
+    service, slow = make_service(monkeypatch, exists=None, recipe_count=None, db=db)
+    service.user_cache.set_exists_and_recipe_count = AsyncMock()
+    monkeypatch.setattr(service, "_lock", fake_lock)
+    service.user_cache.get_exists = AsyncMock(return_value=None)
+    user_repo = MagicMock()
+    user_repo.get_by_id = AsyncMock(return_value=user)
+    user_repo.create = AsyncMock()
+    service.user_repo = MagicMock(return_value=user_repo)
+    recipe_repo = MagicMock()
+    recipe_repo.get_count_by_user = AsyncMock(return_value=4)
+    recipe_repository = MagicMock(return_value=recipe_repo)
+    monkeypatch.setattr(user_service_module, "RecipeRepository", recipe_repository)
+    return service, slow, lock_keys, recipe_repository
+
+
+class TestEnsureUserAndGetRecipeCount:
+
+    async def test_warm_cache_is_one_round_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Оба значения в кэше — БД и отдельные GET не трогаются."""
+        service, slow = make_service(monkeypatch, exists=True, recipe_count=7)
+
+        assert await service.ensure_user_and_get_recipe_count(_USER) == 7
+        service.user_cache.get_exists_and_recipe_count.assert_awaited_once_with(1)
+        slow.ensure_user_exists.assert_not_awaited()
+        slow.get_recipe_count.assert_not_awaited()
+
+    async def test_cold_start_new_user(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Новый пользователь создаётся, счётчик 0 пишется вместе с флагом одной записью."""
+        service, slow, lock_keys, recipe_repository = make_cold_service(user=None, monkeypatch=monkeypatch)
+
+        assert await service.ensure_user_and_get_recipe_count(_USER) == 0
+        service.user_repo.return_value.create.assert_awaited_once_with(_USER)
+        recipe_repository.assert_not_called()
+        service.user_cache.set_exists_and_recipe_count.assert_awaited_once_with(1, 0)
+        assert len(lock_keys) == 1
+        slow.ensure_user_exists.assert_not_awaited()
+        slow.get_recipe_count.assert_not_awaited()
+
+    async def test_cold_start_known_user(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Пользователь есть в БД — счётчик читается в той же сессии, init-lock не берётся."""
+        service, _, lock_keys, _ = make_cold_service(user=MagicMock(id=1), monkeypatch=monkeypatch)
+
+        assert await service.ensure_user_and_get_recipe_count(_USER) == 4
+        service.user_repo.return_value.create.assert_not_awaited()
+        service.user_cache.set_exists_and_recipe_count.assert_awaited_once_with(1, 4)
+        assert lock_keys == []
+
+    async def test_zero_count_is_a_cache_hit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Нулевое количество рецептов — валидное значение кэша, а не промах."""
+        service, slow = make_service(monkeypatch, exists=True, recipe_count=0)
+
+        assert await service.ensure_user_and_get_recipe_count(_USER) == 0
+        slow.get_recipe_count.assert_not_awaited()
+
+    async def test_only_count_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Пользователь уже известен — в медленный путь уходит только подсчёт рецептов."""
+        service, slow = make_service(monkeypatch, exists=True, recipe_count=None)
+
+        assert await service.ensure_user_and_get_recipe_count(_USER) == 3
+        slow.ensure_user_exists.assert_not_awaited()
+        slow.get_recipe_count.assert_awaited_once_with(1)
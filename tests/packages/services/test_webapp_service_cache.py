@@ -0,0 +1,66 @@
+"""Тесты инвалидации кэшей после правки рецепта в WebApp."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from packages.services import webapp_service as webapp_service_module
+from packages.services.webapp_service import WebAppService
+
+
+def make_service(monkeypatch: pytest.MonkeyPatch) -> tuple[WebAppService, MagicMock]:
+    """WebAppService с замоканными Redis-репозиториями; возвращает ещё мок кэша рецептов."""
+    recipe_cache = MagicMock(invalidate_recipe_titles=AsyncMock(), invalidate_search_pages=AsyncMock())
+    monkeypatch.setattr(webapp_service_module, "RecipeCacheRepository", MagicMock(return_value=recipe_cache))
+    monkeypatch.setattr(
+        webapp_service_module,
+        "WebAppRecipeDraftCacheRepository",
+        MagicMock(return_value=MagicMock(clear=AsyncMock())),
+    )
+    service = WebAppService(db=MagicMock(), redis=MagicMock())
+    service.category_cache = MagicMock(invalidate_user_categories=AsyncMock())
+    return service, recipe_cache
+
+
+async def invalidate(service: WebAppService, *, title_changed: bool = False, ingredients_changed: bool = False) -> None:
+    """Правка рецепта 10 пользователя 1 без смены категории и клонирования."""
+    await service._invalidate_caches(
+        user_id=1,
+        old_category_id=2,
+        new_category_id=2,
+        title_changed=title_changed,
+        category_changed=False,
+        membership_changed=False,
+        ingredients_changed=ingredients_changed,
+        draft_recipe_id_to_clear=10,
+    )
+
+
+class TestInvalidateCaches:
+
+    async def test_ingredients_only_drop_search_pages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Правка одних ингредиентов сбрасывает страницы поиска (поиск по ингредиентам)."""
+        service, recipe_cache = make_service(monkeypatch)
+
+        await invalidate(service, ingredients_changed=True)
+
+        recipe_cache.invalidate_search_pages.assert_awaited_once_with(1)
+        recipe_cache.invalidate_recipe_titles.assert_not_awaited()
+
+    async def test_title_change_drops_titles(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Смена названия сбрасывает списки с названиями — поиск уходит вместе с ними."""
+        service, recipe_cache = make_service(monkeypatch)
+
+        await invalidate(service, title_changed=True, ingredients_changed=True)
+
+        recipe_cache.invalidate_recipe_titles.assert_awaited_once_with(1, 2)
+        recipe_cache.invalidate_search_pages.assert_not_awaited()
+
+    async def test_unchanged_recipe_keeps_search_pages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Без изменений, видимых в списках и поиске, кэш рецептов не трогается."""
+        service, recipe_cache = make_service(monkeypatch)
+
+        await invalidate(service)
+
+        recipe_cache.invalidate_search_pages.assert_not_awaited()
+        recipe_cache.invalidate_recipe_titles.assert_not_awaited()